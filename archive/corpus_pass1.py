@@ -1,6 +1,6 @@
 # ============================================================
 # 大規模テキスト（1パス目）
-#   - rglob で再帰走査して対象ファイル台帳を作る
+#   - os.scandir で再帰走査して対象ファイル台帳を作る
 #   - pending/failed だけ処理して tokens.jsonl に追記
 #   - 台帳CSVを更新し、途中停止しても再開できる
 # ============================================================
@@ -8,12 +8,35 @@
 from __future__ import annotations
 
 import json
+import os
+import queue
+import threading
 import time
+import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from itertools import chain
+from operator import methodcaller
 from pathlib import Path
 from typing import Callable, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+# orjson は optional dependency（あれば jsonl の書き出しが速くなる）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow も optional dependency（あれば台帳CSVの読み込みに使う）
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
 
 TokenizeFunc = Callable[..., pd.DataFrame]
 TokenizeTextFunc = Callable[[str], list]
@@ -22,6 +45,23 @@ TokenizeTextFunc = Callable[[str], list]
 # ------------------------------------------------------------
 # 台帳（ジョブ台帳）作成
 # ------------------------------------------------------------
+def _iter_files_with_suffix(root_dir: Path, suffix: str):
+    """
+    root_dir 配下を os.scandir で再帰走査し、(相対パス, ファイル名) を返す。
+    （走査方法は io_text._iter_text_files と同じ。シンボリックリンクのディレクトリはたどらない）
+    """
+    root = str(root_dir)
+    prefix_len = len(os.path.join(root, ""))
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.endswith(suffix) and e.is_file():
+                    yield e.path[prefix_len:], e.name
+
+
 def build_file_manifest(
     root_dir: Union[str, Path],
     *,
@@ -54,29 +94,59 @@ def build_file_manifest(
 
     ext = ext if ext.startswith(".") else f".{ext}"
 
-    files = sorted(root_dir.rglob(f"*{ext}"))
-    records = []
-    doc_id = 0
-
-    for p in files:
-        doc_id += 1
-        rel = str(p.relative_to(root_dir))
-        records.append(
-            {
-                "doc_id": doc_id,
-                "path": rel,
-                "filename": p.name,
-                "ext": p.suffix,
-                "status": "pending",
-                "error": "",
-                "n_chars": pd.NA,
-                "n_tokens": pd.NA,
-                "preview": "",
-                "updated_at": int(time.time()),
-            }
-        )
+    # 相対パスの並びで doc_id を振る（Path のソートと同じく階層ごとに比較）
+    files = sorted(_iter_files_with_suffix(root_dir, ext), key=lambda x: x[0].split(os.sep))
+    n = len(files)
+    now = int(time.time())
+
+    # 列ごとにまとめて作る（行ごとの dict を経由しない）
+    return pd.DataFrame(
+        {
+            "doc_id": np.arange(1, n + 1, dtype=np.int64),
+            "path": [rel for rel, _ in files],
+            "filename": [name for _, name in files],
+            "ext": [os.path.splitext(name)[1] for _, name in files],
+            "status": ["pending"] * n,
+            "error": [""] * n,
+            "n_chars": pd.array([pd.NA] * n, dtype="Int64"),
+            "n_tokens": pd.array([pd.NA] * n, dtype="Int64"),
+            "preview": [""] * n,
+            "updated_at": np.full(n, now, dtype=np.int64),
+        }
+    )
+
+
+def _results_sidecar_path(manifest_csv: Path) -> Path:
+    """処理結果を 1行ずつ追記するチェックポイントファイル（台帳CSVの隣に置く）"""
+    return manifest_csv.with_name(manifest_csv.name + ".results.jsonl")
+
+
+def _replay_results_sidecar(df: pd.DataFrame, sidecar: Path) -> pd.DataFrame:
+    """
+    チェックポイント（doc_id ごとの処理結果）を台帳 df に反映する。
+    同じ doc_id が複数回あれば最後の行を採用する。
+    """
+    rows = []
+    with open(sidecar, "rb") as f:
+        for line in f:
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                # 書き込み途中で止まった最終行は捨てる
+                break
+    if not rows:
+        return df
 
-    return pd.DataFrame.from_records(records)
+    upd = pd.DataFrame(rows).drop_duplicates("doc_id", keep="last").set_index("doc_id")
+    for col in upd.columns:
+        if col not in df.columns:
+            continue
+        # failed 行は n_chars などを持たないので、値のあるセルだけ上書きする
+        vals = df["doc_id"].map(upd[col])
+        hit = vals.notna().to_numpy()
+        if hit.any():
+            df.loc[hit, col] = vals[hit].to_numpy()
+    return df
 
 
 def load_or_create_manifest(
@@ -92,12 +162,36 @@ def load_or_create_manifest(
     manifest_csv = Path(manifest_csv)
 
     if manifest_csv.exists():
-        df = pd.read_csv(manifest_csv)
+        # 行数の多い台帳では pyarrow の CSV パーサ（マルチスレッド）が速い
+        if _HAS_PYARROW:
+            df = pd.read_csv(manifest_csv, engine="pyarrow")
+        else:
+            df = pd.read_csv(manifest_csv)
         # 必要列がない場合はエラー（破損対策）
         required = {"doc_id", "path", "status"}
         missing = required - set(df.columns)
         if missing:
             raise ValueError(f"manifest_csv is missing columns: {missing}")
+        # 空文字だけの列は CSV 読み込みで float(NaN) になるため、文字列列に戻す
+        for col in ("error", "preview"):
+            if col in df.columns:
+                df[col] = df[col].fillna("").astype(str)
+
+        # 前回の実行が途中で止まっていた場合、追記型の処理結果を台帳に反映する
+        sidecar = _results_sidecar_path(manifest_csv)
+        replayed = sidecar.exists()
+        if replayed:
+            df = _replay_results_sidecar(df, sidecar)
+
+        # 欠損を含む整数列は CSV 読み込み・反映で float(11.0 / NaN) になるため、
+        # build_file_manifest と同じ Int64 に戻す（CSV に "11.0" と書かれないように）
+        for col in ("n_chars", "n_tokens"):
+            if col in df.columns:
+                df[col] = df[col].astype("Int64")
+
+        if replayed:
+            df.to_csv(manifest_csv, index=False)
+            sidecar.unlink()
         return df
 
     df = build_file_manifest(root_dir, ext=ext)
@@ -106,6 +200,140 @@ def load_or_create_manifest(
     return df
 
 
+# ------------------------------------------------------------
+# 既定トークナイザ（Sudachi）
+# ------------------------------------------------------------
+# Dictionary の読み込みは重いため、dict_type ごとにモジュール内でキャッシュする
+_SUDACHI_TOKENIZERS: dict = {}
+
+
+def _get_sudachi_tokenizer(dict_type: str = "core"):
+    """dict_type ごとに Sudachi tokenizer を 1回だけ生成して返す"""
+    tok = _SUDACHI_TOKENIZERS.get(dict_type)
+    if tok is None:
+        try:
+            from sudachipy import dictionary as _sudachi_dictionary
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "SudachiPy が未インストールです。Sudachi を使う場合は Colab で `!pip install sudachipy sudachidict_core` を実行してください。"
+            ) from e
+        tok = _sudachi_dictionary.Dictionary(dict=dict_type).create()
+        _SUDACHI_TOKENIZERS[dict_type] = tok
+    return tok
+
+
+def _build_sudachi_text_fn(tokenize_kwargs: dict) -> TokenizeTextFunc:
+    """
+    tokenize_kwargs から「1テキスト → list[str]」の Sudachi 関数を組み立てる。
+
+    分割モード・word_form・品詞/ストップワード集合は組み立て時に 1回だけ解決し、
+    返す関数の既定引数に束縛する（文書ごとの dict.get や分岐を避ける）。
+    """
+    from .preprocess import _compile_pos_filter, _normalize_stopwords
+
+    # 未インストール時の案内は _get_sudachi_tokenizer 側で出す
+    tok = _get_sudachi_tokenizer(tokenize_kwargs.get("dict_type", "core"))
+    from sudachipy import SplitMode
+
+    split_mode = tokenize_kwargs.get("split_mode", None) or "C"
+    mode = getattr(SplitMode, str(split_mode).upper(), SplitMode.C)
+
+    wf = str(tokenize_kwargs.get("word_form", "dictionary")).lower()
+    if wf in {"dictionary", "dict", "base", "lemma"}:
+        get_word = methodcaller("dictionary_form")
+    elif wf in {"surface", "orig", "original"}:
+        get_word = methodcaller("surface")
+    elif wf in {"normalized", "normal", "norm"}:
+        get_word = methodcaller("normalized_form")
+    else:
+        raise ValueError(
+            f"invalid word_form={tokenize_kwargs.get('word_form')!r}. "
+            "Use 'dictionary'/'surface'/'normalized'."
+        )
+
+    keep_set, excl_set = _compile_pos_filter(
+        tokenize_kwargs.get("pos_keep", None),
+        tokenize_kwargs.get("pos_exclude", None),
+        strict=True,
+    )
+    keep_set = frozenset(keep_set) if keep_set is not None else None
+    excl_set = frozenset(excl_set) if excl_set is not None else None
+    stop_set = frozenset(_normalize_stopwords(tokenize_kwargs.get("stopwords", None)))
+
+    def _fast_tok(
+        text: str,
+        _tok=tok,
+        _mode=mode,
+        _get_word=get_word,
+        _keep=keep_set,
+        _excl=excl_set,
+        _stop=stop_set,
+    ) -> list:
+        # tokenize_text_sudachi と同じく前後の空白は落とす（末尾の改行などを語にしない）
+        text = text.strip()
+        if not text:
+            return []
+        out = []
+        for m in _tok.tokenize(text, _mode):
+            if _keep is not None or _excl is not None:
+                pos = m.part_of_speech()[0]
+                if _keep is not None and pos not in _keep:
+                    continue
+                if _excl is not None and pos in _excl:
+                    continue
+            w = _get_word(m)
+            if w in _stop:
+                continue
+            out.append(w)
+        return out
+
+    return _fast_tok
+
+
+def _cache_tokenize_text_fn(fn: TokenizeTextFunc, maxsize: int) -> TokenizeTextFunc:
+    """
+    1テキスト関数の前段に LRU キャッシュを挟む（重複文書・定型文の多いコーパス向け）。
+
+    - キーは本文そのものではなく (文字数, blake2b ダイジェスト) にする（巨大な本文を保持しない）
+    - 結果は tuple で保持し、重複文書の間で共有する
+    - cache_clear() でキャッシュを捨てられる
+    """
+    cache: OrderedDict = OrderedDict()
+
+    def _cached(text: str):
+        key = (len(text), blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+            return hit
+        tokens = tuple(fn(text))
+        cache[key] = tokens
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+        return tokens
+
+    _cached.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return _cached
+
+
+def _chunked_tokenize_text_fn(fn: TokenizeTextFunc, max_chars: int) -> TokenizeTextFunc:
+    """
+    max_chars 文字を超える本文は断片ごとにトークナイズして連結する。
+
+    形態素解析のラティスは入力が長いほど重くなり、SudachiPy には入力長の上限
+    （約 49KB）もあるため、巨大なファイル 1つで全体が止まらないようにする。
+    切り方は tokenize_df(max_chunk_chars=...) と共通（preprocess._split_long_text）。
+    """
+    from .preprocess import _split_long_text
+
+    def _chunked(text: str):
+        if len(text) <= max_chars:
+            return fn(text)
+        return list(chain.from_iterable(fn(t) for t in _split_long_text(text, max_chars)))
+
+    return _chunked
+
+
 # ------------------------------------------------------------
 # tokens.jsonl 追記用の小関数
 # ------------------------------------------------------------
@@ -115,12 +343,242 @@ def append_tokens_jsonl(
     doc_id: int,
     path: str,
     tokens: list[str],
+    token_format: str = "array",
 ) -> None:
     """
     1文書分を 1行JSON として jsonl に追記する。
+
+    jsonl_fp はバイナリモード（"ab"）で開いたファイルを渡すこと。
+    orjson があれば使い、なければ標準の json で UTF-8 バイト列を作る。
+
+    token_format:
+      - "array"  : {"doc_id", "path", "tokens": [...]}（既定）
+      - "joined" : {"doc_id", "path", "text": "半角スペース区切り", "n": トークン数}
+                   読み込み側は text.split(" ") で tokens に戻せる。
+                   空文字や半角スペースを含むトークンがある文書は、
+                   元に戻せないため "array" 形式で書く。
     """
+    if token_format == "joined":
+        text = " ".join(tokens)
+        if text.count(" ") == len(tokens) - 1 and "" not in tokens:
+            out = {"doc_id": doc_id, "path": path, "text": text, "n": len(tokens)}
+            jsonl_fp.write(_dumps_jsonl_line(out))
+            return
     out = {"doc_id": doc_id, "path": path, "tokens": tokens}
-    jsonl_fp.write(json.dumps(out, ensure_ascii=False) + "\n")
+    jsonl_fp.write(_dumps_jsonl_line(out))
+
+
+def _dumps_jsonl_line(obj: dict) -> bytes:
+    """dict を jsonl の 1行（末尾改行つき UTF-8 バイト列）にする"""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+# ------------------------------------------------------------
+# トークナイズ関数の決定（メインプロセス / ワーカー共通）
+# ------------------------------------------------------------
+def _resolve_tokenize_text_fn(
+    tokenize_text_fn: Optional[TokenizeTextFunc],
+    tokenize_func: Optional[TokenizeFunc],
+    tokenize_kwargs: dict,
+    id_col: str,
+    text_col: str,
+    cache_size: int,
+    max_chunk_chars: int = 0,
+) -> TokenizeTextFunc:
+    """
+    1テキスト→tokens を返す関数を決定する。
+      - tokenize_text_fn（推奨）: そのまま使う（高速）
+      - tokenize_func（互換）  : df→tok_df を返す従来の tokenize_* を包む
+      - どちらも未指定         : 既定の Sudachi 関数を組み立てる
+    """
+    if tokenize_text_fn is None:
+        if tokenize_func is None:
+            # 既定：Sudachi（大規模処理向け）。tokenizer・分割モード・フィルタ集合は
+            # ここで 1回だけ解決し、文書ごとのループでは使い回す
+            tokenize_text_fn = _build_sudachi_text_fn(tokenize_kwargs)
+
+        else:
+            tokenize_text_fn = _text_fn_from_tokenize_df(tokenize_func, tokenize_kwargs)
+
+        if tokenize_text_fn is None:
+            # 互換：従来の tokenize_*（df→tok_df）を 1文書 DataFrame で呼ぶ
+            # （文書ごとに DataFrame を 2つ作るため遅い）
+            warnings.warn(
+                "tokenize_func は 1文書ごとに DataFrame を作るため遅くなります。"
+                "大規模データでは tokenize_text_fn（1テキスト→tokens）を指定してください。",
+                stacklevel=3,
+            )
+
+            def tokenize_text_fn(text: str) -> list:
+                df_one = pd.DataFrame({id_col: [0], text_col: [text]})
+                tok_df = tokenize_func(df_one, id_col=id_col, text_col=text_col, **tokenize_kwargs)
+                if "word" not in tok_df.columns:
+                    raise KeyError("tokenize_func output must contain 'word' column")
+                return _word_col_to_list(tok_df["word"])
+
+    if cache_size > 0:
+        tokenize_text_fn = _cache_tokenize_text_fn(tokenize_text_fn, cache_size)
+
+    if max_chunk_chars > 0:
+        # キャッシュより外側に置く（断片ごとにキャッシュが効く）
+        tokenize_text_fn = _chunked_tokenize_text_fn(tokenize_text_fn, max_chunk_chars)
+
+    return tokenize_text_fn
+
+
+def _text_fn_from_tokenize_df(
+    tokenize_func: TokenizeFunc,
+    tokenize_kwargs: dict,
+) -> Optional[TokenizeTextFunc]:
+    """
+    tokenize_func が libs.preprocess.tokenize_df の場合、同じ結果（word 列）を返す
+    1テキスト関数を組み立てる（DataFrame の往復を省く）。
+    それ以外の関数なら None を返す。
+    """
+    try:
+        from .preprocess import (
+            _compile_pos_filter,
+            _make_tokenize_text_fn,
+            _normalize_stopwords,
+            tokenize_df,
+        )
+    except ImportError:
+        return None
+
+    if tokenize_func is not tokenize_df:
+        return None
+
+    # tokenize_df と同じく、品詞の指定ミスはここで 1回だけ検査する
+    keep_set, excl_set = _compile_pos_filter(
+        tokenize_kwargs.get("pos_keep", None),
+        tokenize_kwargs.get("pos_exclude", None),
+        strict=True,
+    )
+    stop_set = _normalize_stopwords(tokenize_kwargs.get("stopwords", None))
+
+    base_fn = tokenize_kwargs.get("tokenize_text_fn", None)
+    if base_fn is None:
+        # engine の振り分けは tokenize_df と共通の関数に任せる（品詞フィルタも中で掛ける）
+        base_fn = _make_tokenize_text_fn(
+            tokenize_kwargs.get("engine", "janome"),
+            tokenize_kwargs.get("tokenizer", None),
+            tokenize_kwargs.get("use_base_form", True),
+            None,
+            frozenset(keep_set) if keep_set is not None else None,
+            frozenset(excl_set) if excl_set is not None else None,
+        )
+        keep_set = excl_set = None
+
+    def _fn(text: str) -> list:
+        return [
+            word
+            for word, pos, _ in base_fn(text)
+            if (keep_set is None or pos in keep_set)
+            and (excl_set is None or pos not in excl_set)
+            and word not in stop_set
+        ]
+
+    return _fn
+
+
+def _word_col_to_list(words: pd.Series) -> list[str]:
+    """
+    word 列を欠損を除いた list[str] にする。
+    トークナイザの出力はほぼ str なので、astype(str) で Series を作り直さず、
+    str 以外が混ざっているときだけ変換する。
+    """
+    arr = words.to_numpy(dtype=object)
+    out = arr[pd.notna(arr)].tolist()
+    if all(type(w) is str for w in out):
+        return out
+    return [str(w) for w in out]
+
+
+def _to_token_strs(raw_tokens) -> list[str]:
+    """raw_tokens が TokenRecord 形式（(word, pos, info)）の場合もあるため吸収する"""
+    if len(raw_tokens) == 0:
+        return []
+    first = raw_tokens[0]
+    if isinstance(first, tuple) and len(first) >= 1:
+        return [str(t[0]) for t in raw_tokens]  # type: ignore[index]
+    if all(type(t) is str for t in raw_tokens):
+        # 既に str のリスト（通常のケース）：要素ごとの str() を省く
+        return raw_tokens if type(raw_tokens) is list else list(raw_tokens)
+    return [str(t) for t in raw_tokens]
+
+
+def _iter_prefetched(items, read_fn: Callable, maxsize: int):
+    """
+    items の各 (i, doc_id, rel_path) について read_fn(rel_path) -> (text, error) を
+    別スレッドで先読みし、(i, doc_id, rel_path, text, error) を元の順序で返す。
+
+    ファイル読み込み（特に Google Drive などのネットワーク FS）の待ち時間を
+    トークナイズと重ねるためのもの。先読みは最大 maxsize 件まで（0 以下なら先読みしない）。
+    """
+    if maxsize <= 0:
+        for i, doc_id, rel_path in items:
+            yield (i, doc_id, rel_path, *read_fn(rel_path))
+        return
+
+    q: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    end = object()
+
+    def _put(obj) -> bool:
+        # 受け取り側が途中でやめた場合（例外など）に詰まらないよう、stop を見ながら待つ
+        while not stop.is_set():
+            try:
+                q.put(obj, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _producer() -> None:
+        for i, doc_id, rel_path in items:
+            if not _put((i, doc_id, rel_path, *read_fn(rel_path))):
+                return
+        _put(end)
+
+    t = threading.Thread(target=_producer, daemon=True)
+    t.start()
+    try:
+        while True:
+            item = q.get()
+            if item is end:
+                break
+            yield item
+    finally:
+        stop.set()
+
+
+# ------------------------------------------------------------
+# 並列処理（n_jobs > 1）用のワーカー
+#   - tokenizer は pickle できないため、各ワーカーが initializer で自前に作る
+# ------------------------------------------------------------
+_WORKER_TOKENIZE_TEXT_FN: Optional[TokenizeTextFunc] = None
+
+
+def _init_pass1_worker(*resolve_args) -> None:
+    global _WORKER_TOKENIZE_TEXT_FN
+    _WORKER_TOKENIZE_TEXT_FN = _resolve_tokenize_text_fn(*resolve_args)
+
+
+def _pass1_worker_batch(batch: list) -> list:
+    """
+    [(k, text), ...] をトークナイズして [(k, tokens or None, error), ...] を返す。
+    1文書の失敗でバッチ全体を止めない。
+    """
+    fn = _WORKER_TOKENIZE_TEXT_FN
+    out = []
+    for k, text in batch:
+        try:
+            out.append((k, _to_token_strs(fn(text)), ""))
+        except Exception as e:
+            out.append((k, None, f"{type(e).__name__}: {e}"))
+    return out
 
 
 # ------------------------------------------------------------
@@ -146,8 +604,21 @@ def process_manifest_to_jsonl(
     statuses_to_process: tuple[str, ...] = ("pending", "failed"),
     # トークナイズ追加引数（Sudachi の mode / word_form 等）
     tokenize_kwargs: Optional[dict] = None,
-    # 台帳をどれくらいの頻度で保存するか（安全側：毎回）
-    save_every: int = 1,
+    # 処理結果のチェックポイントを何文書ごとにディスクへ確定（fsync）するか
+    save_every: int = 100,
+    # 同一本文のトークナイズ結果を使い回す件数（0 なら無効）
+    cache_size: int = 0,
+    # 並列数（1 なら逐次処理）と、1ワーカーに渡す文書数
+    n_jobs: int = 1,
+    chunk_size: int = 64,
+    # ファイルを別スレッドで先読みする件数（0 なら先読みしない）
+    prefetch: int = 64,
+    # これより長い本文は改行・文末で分けてからトークナイズする（0 なら分けない）
+    max_chunk_chars: int = 10_000,
+    # tokens.jsonl の 1行の形式（"array" / "joined"、append_tokens_jsonl を参照）
+    token_format: str = "array",
+    # False の場合、stopwords の除去を 1パス目では行わない（2パス目でまとめて除去する）
+    filter_in_pass1: bool = True,
 ) -> pd.DataFrame:
     """
     台帳CSVを読み込み（なければ作成）、
@@ -155,6 +626,41 @@ def process_manifest_to_jsonl(
     status が pending/failed の行だけを処理して tokens.jsonl に追記する。
     処理結果は台帳CSVへ反映されるため、途中で落ちても再開できる。
 
+    処理中は台帳CSV全体を書き直さず、1文書ごとの結果を
+    `<manifest_csv>.results.jsonl` に追記する（save_every 件ごとにディスクへ確定）。
+    台帳CSVは最後に 1回だけ保存し、途中で止まった場合は次回の読み込み時に
+    このチェックポイントが台帳へ反映される。
+
+    確定（fsync）は jsonl とチェックポイントの 2ファイルに対して行うため、Google Drive 上では
+    1回ごとの待ち時間が大きい。既定の save_every=100 では、ランタイムが突然落ちた場合に
+    最後の確定以降（最大 99 文書）が pending のまま残って再処理され、tokens.jsonl に
+    同じ doc_id の行が重複することがある（2パス目は doc_id ごとに最後の行を使うこと）。
+    Python の例外で止まった場合は、ファイルを閉じる時点で書き出されるので失われない。
+    1 にすると 1文書ごとに確定する（最も安全だが遅い）。
+
+    cache_size > 0 の場合、本文のハッシュをキーにした LRU キャッシュを
+    トークナイズ関数の前段に挟み、重複文書（定型文・ミラーなど）の再解析を省く。
+
+    n_jobs > 1 の場合、ファイル読み込みと jsonl / 台帳の更新はメインプロセスで行い、
+    トークナイズだけを chunk_size 文書ずつプロセスプールに渡す（各ワーカーが
+    tokenizer を自前で生成する）。spawn 方式の環境では tokenize_text_fn /
+    tokenize_func は pickle 可能なモジュールレベル関数にしてください。
+    jsonl への出力順は逐次処理と同じ（台帳順）です。設定の誤りはワーカー起動前に
+    メインプロセスで例外になります（n_jobs=1 と同じ）。
+
+    ファイルの読み込みは別スレッドで最大 prefetch 件まで先読みし、
+    読み込みの待ち時間（Google Drive 上のファイルなど）をトークナイズと重ねる。
+
+    max_chunk_chars 文字を超える本文は、改行・文末記号（。！？）の直後で
+    断片に分けてからトークナイズし、トークン列を連結して 1文書として書き出す。
+    巨大なファイルで解析が極端に遅くなる（SudachiPy では入力長の上限エラーになる）
+    のを避けるため。
+
+    filter_in_pass1=False の場合、tokenize_kwargs の stopwords を 1パス目では使わず、
+    すべてのトークンを jsonl に書き出す。文書ごとに除去するより、2パス目で
+    全トークンを 1本の列にしてから isin でまとめて除去するほうが速い。
+    （何を除去するかを後から変えても 1パス目をやり直さずに済む）
+
     Returns
     -------
     pd.DataFrame
@@ -164,55 +670,30 @@ def process_manifest_to_jsonl(
     manifest_csv = Path(manifest_csv)
     jsonl_path = Path(jsonl_path)
 
-    tokenize_kwargs = tokenize_kwargs or {}
+    if token_format not in ("array", "joined"):
+        raise ValueError(f'token_format は "array" / "joined" のいずれかを指定してください: {token_format!r}')
+
+    tokenize_kwargs = dict(tokenize_kwargs or {})
     # 1パス目は軽量が基本：token_info を切る（必要なら呼び出し側で上書き）
     tokenize_kwargs.setdefault("extra_col", None)
     tokenize_kwargs.setdefault("extra_info", False)
 
-    # ------------------------------------------------------------
-    # トークナイズ関数の決定
-    #   - tokenize_text_fn（推奨）: 1テキスト→tokens を返す（高速）
-    #   - tokenize_func（互換）  : df→tok_df を返す（従来の tokenize_*）
-    # ------------------------------------------------------------
-    if tokenize_text_fn is None:
-        if tokenize_func is None:
-            # 既定：Sudachi（大規模処理向け）。ここで tokenizer を 1回だけ作って使い回す
-            try:
-                from .preprocess import tokenize_text_sudachi
-            except Exception as e:  # pragma: no cover
-                raise RuntimeError("tokenize_text_fn / tokenize_func が未指定で、既定トークナイザの読み込みに失敗しました。") from e
-
-            # tokenizer を一度だけ生成
-            try:
-                from sudachipy import dictionary as _sudachi_dictionary
-            except ModuleNotFoundError as e:
-                raise ModuleNotFoundError(
-                    "SudachiPy が未インストールです。Sudachi を使う場合は Colab で `!pip install sudachipy sudachidict_core` を実行してください。"
-                ) from e
-
-            _tok = _sudachi_dictionary.Dictionary().create()
-
-            def tokenize_text_fn(text: str) -> list:
-                return tokenize_text_sudachi(
-                    text,
-                    tokenizer=_tok,
-                    split_mode=tokenize_kwargs.get("split_mode", None),
-                    dict_type=tokenize_kwargs.get("dict_type", "core"),
-                    word_form=tokenize_kwargs.get("word_form", "dictionary"),
-                    pos_keep=tokenize_kwargs.get("pos_keep", None),
-                    stopwords=tokenize_kwargs.get("stopwords", None),
-                    extra_info=bool(tokenize_kwargs.get("extra_info", False)),
-                )
-
-        else:
-            # 互換：従来の tokenize_*（df→tok_df）を 1文書 DataFrame で呼ぶ
-            def tokenize_text_fn(text: str) -> list:
-                df_one = pd.DataFrame({id_col: [0], text_col: [text]})
-                tok_df = tokenize_func(df_one, id_col=id_col, text_col=text_col, **tokenize_kwargs)
-                if "word" not in tok_df.columns:
-                    raise KeyError("tokenize_func output must contain 'word' column")
-                return tok_df["word"].dropna().astype(str).tolist()
-
+    if not filter_in_pass1:
+        # jsonl には品詞を残さないため、品詞フィルタは後回しにできない
+        if tokenize_kwargs.get("pos_keep") or tokenize_kwargs.get("pos_exclude"):
+            raise ValueError(
+                "filter_in_pass1=False では pos_keep / pos_exclude は使えません"
+                "（tokens.jsonl に品詞が残らないため）。"
+            )
+        tokenize_kwargs.pop("stopwords", None)
+
+    resolve_args = (
+        tokenize_text_fn, tokenize_func, tokenize_kwargs, id_col, text_col, cache_size, max_chunk_chars,
+    )
+    # n_jobs > 1 でもメイン側で 1回組み立てる。設定の誤り（SudachiPy 未導入・word_form の
+    # 指定ミスなど）はワーカーを起動する前にここで例外にする
+    # （ワーカーは initializer で自前の tokenizer を作り直す）
+    tokenize_text_fn = _resolve_tokenize_text_fn(*resolve_args)
 
     df = load_or_create_manifest(root_dir, manifest_csv=manifest_csv, ext=ext)
 
@@ -221,73 +702,205 @@ def process_manifest_to_jsonl(
 
     jsonl_path.parent.mkdir(parents=True, exist_ok=True)
 
-    processed = 0
-
-    with open(jsonl_path, "a", encoding="utf-8") as f_jsonl:
-        for i, row in df.iterrows():
-            status = str(row.get("status", "pending"))
-            if status not in statuses_to_process:
-                continue
+    # ------------------------------------------------------------
+    # 処理対象の行を先にまとめて抜き出す
+    #   - iterrows は 1行ごとに Series を作るので遅い
+    #   - df.at[] による 1セルずつの更新も避け、結果は列ごとのリストに溜める
+    # ------------------------------------------------------------
+    #   - status の判定は isin 1回で済ませ、done の行は最初から回さない
+    #     （status が空の行は pending とみなす）
+    todo_pos = np.flatnonzero(
+        df["status"].fillna("pending").isin(statuses_to_process).to_numpy()
+    )
+    todo_index = df.index[todo_pos]
+    todo_doc_ids = df["doc_id"].to_numpy(dtype="int64")[todo_pos].tolist()
+    todo_paths = df["path"].to_numpy(dtype=object)[todo_pos].astype(str).tolist()
+
+    # 処理した行（成功・失敗とも）：status / error / updated_at
+    upd_index: list = []
+    upd_status: list[str] = []
+    upd_error: list[str] = []
+    upd_time: list[int] = []
+    # 成功した行のみ：n_chars / n_tokens / preview
+    done_index: list = []
+    done_chars: list[int] = []
+    done_tokens: list[int] = []
+    done_preview: list[str] = []
+
+    def _flush_updates() -> None:
+        """溜めた結果を台帳 df にまとめて反映する"""
+        if upd_index:
+            df.loc[upd_index, "status"] = upd_status
+            df.loc[upd_index, "error"] = upd_error
+            df.loc[upd_index, "updated_at"] = upd_time
+        if done_index:
+            df.loc[done_index, "n_chars"] = done_chars
+            df.loc[done_index, "n_tokens"] = done_tokens
+            df.loc[done_index, "preview"] = done_preview
+        for buf in (
+            upd_index, upd_status, upd_error, upd_time,
+            done_index, done_chars, done_tokens, done_preview,
+        ):
+            buf.clear()
 
-            doc_id = int(row["doc_id"])
-            rel_path = str(row["path"])
-            p = root_dir / rel_path
+    processed = 0
 
+    def _tick() -> None:
+        """1文書処理するごとに呼ぶ（save_every ごとにチェックポイントを確定）"""
+        nonlocal processed
+        processed += 1
+        if processed % save_every == 0:
+            _checkpoint()
+
+    def _checkpoint() -> None:
+        # 台帳CSV全体は毎回書き直さない（件数が多いと O(N^2) の I/O になる）。
+        # 代わりに追記型のチェックポイントをディスクまで書き出す。
+        # done の記録が jsonl より先に残らないよう、jsonl → チェックポイントの順に確定する。
+        for fp in (f_jsonl, f_results):
+            fp.flush()
+            os.fsync(fp.fileno())
+
+    def _record_failed(i, doc_id: int, message: str) -> None:
+        now = int(time.time())
+        f_results.write(_dumps_jsonl_line(
+            {"doc_id": doc_id, "status": "failed", "error": message, "updated_at": now}
+        ))
+        upd_index.append(i)
+        upd_status.append("failed")
+        upd_error.append(message)
+        upd_time.append(now)
+
+    def _record_done(i, doc_id: int, rel_path: str, n_chars: int, preview: str, tokens: list[str]) -> None:
+        # jsonl 追記（成功したものだけ積む）
+        append_tokens_jsonl(
+            f_jsonl,
+            doc_id=doc_id,
+            path=rel_path,
+            tokens=tokens,
+            token_format=token_format,
+        )
+        now = int(time.time())
+        f_results.write(_dumps_jsonl_line({
+            "doc_id": doc_id, "status": "done", "error": "", "updated_at": now,
+            "n_chars": n_chars, "n_tokens": len(tokens), "preview": preview,
+        }))
+        # 台帳更新（列ごとのリストに溜める）
+        upd_index.append(i)
+        upd_status.append("done")
+        upd_error.append("")
+        upd_time.append(now)
+        done_index.append(i)
+        done_chars.append(n_chars)
+        done_tokens.append(len(tokens))
+        done_preview.append(preview)
+
+    def _read(rel_path: str) -> tuple[Optional[str], str]:
+        """(本文, エラー文) を返す。失敗時の本文は None"""
+        try:
+            # バイト列で一括して読み、まとめて decode する（TextIOWrapper を通さない）
+            with open(os.path.join(root_str, rel_path), "rb") as f:
+                text = f.read().decode(encoding, errors)
+        except FileNotFoundError:
             # 存在しない場合は failed 扱いで台帳更新
-            if not p.exists():
-                df.at[i, "status"] = "failed"
-                df.at[i, "error"] = f"file not found: {rel_path}"
-                df.at[i, "updated_at"] = int(time.time())
-                processed += 1
-                if processed % save_every == 0:
-                    df.to_csv(manifest_csv, index=False)
-                continue
+            return None, f"file not found: {rel_path}"
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
+        # read_text と同じく改行を \n にそろえる（\r を含むときだけ）
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text, ""
+
+    root_str = str(root_dir)
+    results_path = _results_sidecar_path(manifest_csv)
+
+    # 読み込みは別スレッドで先読みし、トークナイズと重ねる
+    reads = _iter_prefetched(zip(todo_index, todo_doc_ids, todo_paths), _read, prefetch)
+
+    # jsonl はバイナリ追記 + 大きめのバッファで開き、書き込みの syscall を減らす
+    with open(jsonl_path, "ab", buffering=1 << 20) as f_jsonl, \
+            open(results_path, "ab", buffering=1 << 16) as f_results:
+        if n_jobs <= 1:
+            # ----------------------------------------------------
+            # 逐次処理
+            # ----------------------------------------------------
+            for i, doc_id, rel_path, text, err in reads:
+                # 1) read（失敗していれば failed 扱い）
+                if text is None:
+                    _record_failed(i, doc_id, err)
+                    _tick()
+                    continue
+
+                try:
+                    preview = text[:preview_chars].replace("\n", "\\n")
+                    # 2) tokenize（推奨：1テキスト関数を直接呼ぶ）
+                    tokens = _to_token_strs(tokenize_text_fn(text))
+                    # 3) jsonl 追記 + 4) 台帳更新
+                    _record_done(i, doc_id, rel_path, len(text), preview, tokens)
+                except Exception as e:
+                    _record_failed(i, doc_id, f"{type(e).__name__}: {e}")
+
+                _tick()
 
-            try:
-                # 1) read
-                text = p.read_text(encoding=encoding, errors=errors)
-                n_chars = len(text)
-                preview = text[:preview_chars].replace("\n", "\\n")
-                # 2) tokenize（推奨：1テキスト関数を直接呼ぶ）
-                raw_tokens = tokenize_text_fn(text)
-
-                # raw_tokens が TokenRecord 形式（(word, pos, info)）の場合もあるため吸収する
-                if len(raw_tokens) == 0:
-                    tokens = []
-                else:
-                    first = raw_tokens[0]
-                    if isinstance(first, tuple) and len(first) >= 1:
-                        tokens = [str(t[0]) for t in raw_tokens]  # type: ignore[index]
+        else:
+            # ----------------------------------------------------
+            # 並列処理：読み込みはメイン側、トークナイズはワーカー
+            #   - 投入中のバッチ数を 2 * n_jobs に抑え、本文を溜め込みすぎない
+            #   - 結果は投入順に受け取るので、jsonl の順序は逐次処理と同じ
+            # ----------------------------------------------------
+            in_flight: deque = deque()
+
+            def _drain_one() -> None:
+                fut, metas = in_flight.popleft()
+                try:
+                    results = fut.result()
+                except Exception as e:
+                    # ワーカー自体が落ちた場合はバッチ全体を failed にする
+                    results = [(k, None, f"{type(e).__name__}: {e}") for k in range(len(metas))]
+                for k, tokens, err in results:
+                    i, doc_id, rel_path, n_chars, preview = metas[k]
+                    if tokens is None:
+                        _record_failed(i, doc_id, err)
                     else:
-                        tokens = [str(t) for t in raw_tokens]
-
-                n_tokens = len(tokens)
-
-                # 3) jsonl 追記（成功したものだけ積む）
-                append_tokens_jsonl(
-                    f_jsonl,
-                    doc_id=doc_id,
-                    path=rel_path,
-                    tokens=tokens,
-                )
-
-                # 4) 台帳更新
-                df.at[i, "status"] = "done"
-                df.at[i, "error"] = ""
-                df.at[i, "n_chars"] = n_chars
-                df.at[i, "n_tokens"] = n_tokens
-                df.at[i, "preview"] = preview
-                df.at[i, "updated_at"] = int(time.time())
-
-            except Exception as e:
-                df.at[i, "status"] = "failed"
-                df.at[i, "error"] = f"{type(e).__name__}: {e}"
-                df.at[i, "updated_at"] = int(time.time())
-
-            processed += 1
-            if processed % save_every == 0:
-                df.to_csv(manifest_csv, index=False)
-
-    # 最後に確実に保存
+                        try:
+                            _record_done(i, doc_id, rel_path, n_chars, preview, tokens)
+                        except Exception as e:
+                            _record_failed(i, doc_id, f"{type(e).__name__}: {e}")
+                    _tick()
+
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_pass1_worker,
+                initargs=resolve_args,
+            ) as ex:
+                batch: list = []
+                metas: list = []
+
+                def _submit() -> None:
+                    nonlocal batch, metas
+                    in_flight.append((ex.submit(_pass1_worker_batch, batch), metas))
+                    batch, metas = [], []
+                    while len(in_flight) >= 2 * n_jobs:
+                        _drain_one()
+
+                for i, doc_id, rel_path, text, err in reads:
+                    if text is None:
+                        _record_failed(i, doc_id, err)
+                        _tick()
+                        continue
+                    preview = text[:preview_chars].replace("\n", "\\n")
+                    batch.append((len(metas), text))
+                    metas.append((i, doc_id, rel_path, len(text), preview))
+                    if len(batch) >= max(1, chunk_size):
+                        _submit()
+
+                if batch:
+                    _submit()
+                while in_flight:
+                    _drain_one()
+
+    _flush_updates()
+
+    # 最後に台帳CSVへまとめて保存し、反映済みのチェックポイントを消す
     df.to_csv(manifest_csv, index=False)
+    results_path.unlink(missing_ok=True)
     return df
@@ -1,9 +1,12 @@
 from .preprocess import (
     tokenize_df,
+    iter_tokenize_df,
     tokenize_text_janome,
     tokenize_text_sudachi,
+    tokenize_text_fugashi,
     filter_tokens_df,
     tokens_to_text,
+    tokenize_to_text,
 )
 
 from .io_text import build_text_df
@@ -19,14 +22,17 @@ from .bow import create_wordcloud
 __all__ = [
     # 前処理（入口）
     "tokenize_df",
+    "iter_tokenize_df",
 
     # 前処理（高速・内部用）
     "tokenize_text_janome",
     "tokenize_text_sudachi",
+    "tokenize_text_fugashi",
 
     # 前処理後ユーティリティ
     "filter_tokens_df",
     "tokens_to_text",
+    "tokenize_to_text",
 
     # テキスト入出力（基本）
     "build_text_df",
@@ -22,14 +22,24 @@ def create_wordcloud(
     width=1200,
     height=800,
     random_state=42,
+    render="mpl",
 ):
     """
     分かち書き済みテキストから WordCloud を生成する。
 
+    render:
+      - "mpl"  : matplotlib で表示し、outfile があれば savefig で保存する（既定）
+      - "pil"  : 表示せず、WordCloud の画像（PIL）をそのまま outfile に保存する
+      - "none" : 表示も保存もせず、WordCloud オブジェクトだけを返す
+
     Notes
     -----
     - font_path は、日本語フォントファイルのパスを指定すること
       （例：matplotlib 日本語フォント設定テンプレで得たパスを渡す）
+    - 同じ sentence・同じ random_state なら、何度呼んでも同じ配置になる
+    - collocations（2語の連語）は常に False。分かち書き済みテキストでは不要で、
+      大きなテキストでは計算量も増えるため
+    - ファイル保存だけが目的なら render="pil" が速い（matplotlib を経由しない）
     """
 
     if WordCloud is None:
@@ -45,6 +55,9 @@ def create_wordcloud(
             "例: create_wordcloud(sentence, font_path=font_path)"
         )
 
+    if render not in ("mpl", "pil", "none"):
+        raise ValueError(f'render は "mpl" / "pil" / "none" のいずれかを指定してください: {render!r}')
+
     if stopwords is None:
         stopwords = set()
     else:
@@ -53,6 +66,8 @@ def create_wordcloud(
     if not sentence or not sentence.strip():
         raise ValueError("sentence が空です。tokens_to_text の結果を確認してください。")
 
+    # WordCloud は呼び出しごとに作る（random_state から作られる乱数生成器を
+    # 呼び出し間で共有すると、同じ random_state でも配置が変わってしまう）
     wcloud = WordCloud(
         background_color=background_color,
         font_path=font_path,
@@ -63,6 +78,15 @@ def create_wordcloud(
         collocations=False,
     ).generate(sentence)
 
+    # 画像だけ欲しい場合は matplotlib の figure を作らない
+    # （WordCloud はラスタ画像なので、to_file でも imshow と同じ画素になる）
+    if render == "pil":
+        if outfile is not None:
+            wcloud.to_file(outfile)
+        return wcloud
+    if render == "none":
+        return wcloud
+
     plt.figure(figsize=figsize)
     plt.imshow(wcloud)
     plt.axis("off")
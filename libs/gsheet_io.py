@@ -2,7 +2,7 @@
 # Google スプレッドシート I/O（書き込み）
 # ------------------------------------------------------------
 # - Google Colab 前提（認証済み gspread client を受け取る）
-# - gspread_dataframe.set_with_dataframe を使用
+# - ヘッダ + 本体を値の 2次元リストにして、リサイズと合わせて 1回の batchUpdate で書き込む
 # - 「とりあえず df を出力して確認したい」用途を強く意識
 #
 # 改善点（2025-12）
@@ -14,15 +14,23 @@
 
 from __future__ import annotations
 
+import json
+import math
 from typing import Any, Iterable, Union
 
 import pandas as pd
-from gspread_dataframe import set_with_dataframe
 
 
 # モジュール内キャッシュ（Colab の認証・初期化を毎回走らせない）
 _GC = None
 
+# (sheet_url, sheet_name) -> [gc, spreadsheet, sheetId, (行数, 列数)]
+# 同じシートに何度も書き込むときに、open_by_url / worksheet の往復を省く
+_WS_CACHE: dict[tuple[str, str], list] = {}
+
+# 1回の batchUpdate で送るデータ量の目安（API の上限は約 10MB。余裕を持たせる）
+_MAX_REQUEST_BYTES = 8_000_000
+
 
 def get_gspread_client_colab(*, force: bool = False):
     """
@@ -54,16 +62,13 @@ def get_gspread_client_colab(*, force: bool = False):
 
 def _make_unique(names: Iterable[str]) -> list[str]:
     """列名を重複なしに整形する（例: a, a -> a, a_2）"""
-    seen: dict[str, int] = {}
+    counts: dict[str, int] = {}
     out: list[str] = []
-    for n in names:
-        base = str(n)
-        if base not in seen:
-            seen[base] = 1
-            out.append(base)
-        else:
-            seen[base] += 1
-            out.append(f"{base}_{seen[base]}")
+    append = out.append
+    for base in map(str, names):
+        c = counts.get(base, 0) + 1
+        counts[base] = c
+        append(base if c == 1 else f"{base}_{c}")
     return out
 
 
@@ -73,12 +78,15 @@ def _flatten_columns(cols: Any) -> list[str]:
     例: ('a','b') -> 'a|b'
     """
     if isinstance(cols, pd.MultiIndex):
-        flat: list[str] = []
-        for tup in cols.to_list():
-            parts = [str(x) for x in tup if x is not None and str(x) != ""]
-            flat.append("|".join(parts) if parts else "")
-        return flat
-    return [str(c) if c is not None else "" for c in list(cols)]
+        # to_numpy() は tuple の object 配列（中間の list を作らない）
+        return [
+            "|".join([s for s in (str(x) for x in tup if x is not None) if s])
+            for tup in cols.to_numpy()
+        ]
+    if isinstance(cols, pd.Index) and not cols.hasnans:
+        # None を含まない通常の列名は一括で文字列化する
+        return list(map(str, cols))
+    return [str(c) if c is not None else "" for c in cols]
 
 
 def normalize_for_gsheet(
@@ -100,10 +108,11 @@ def normalize_for_gsheet(
         name = obj.name if obj.name is not None and str(obj.name) != "" else "count"
         df = obj.to_frame(name=name)
     else:
-        df = obj.copy()
+        # 列名を付け替えるだけなので、データはコピーしない（浅いコピーで呼び出し元の df は変えない）
+        df = obj.copy(deep=False)
 
     # index を列として残したい場合：
-    # - include_index=True のときは set_with_dataframe 側で index を出すので reset_index はしない
+    # - include_index=True のときは書き込み時に index を列として出すので reset_index はしない
     # - include_index=False でも、index が RangeIndex 以外なら情報が落ちるので reset_index する
     if not include_index:
         if not isinstance(df.index, pd.RangeIndex) or (df.index.name is not None):
@@ -126,6 +135,147 @@ def normalize_for_gsheet(
     return df
 
 
+def _to_cell(v: Any) -> Any:
+    """Sheets API にそのまま送れる値に変換する（文字列・数値・bool 以外は str）"""
+    if isinstance(v, (str, int, float, bool)):
+        return v
+    return str(v)
+
+
+def _to_sheet_values(df: pd.DataFrame, *, include_index: bool = False) -> list[list[Any]]:
+    """
+    DataFrame を「ヘッダ行 + 本体」の 2次元リストにする。
+
+    - 欠損値（NaN / None / NaT など）は空文字にする
+    - include_index=True の場合は index を先頭列として含める
+    - DataFrame のコピーは作らず、object 配列を 1回だけ作って変換する
+    """
+    if include_index:
+        df = df.reset_index()
+
+    header = [str(c) for c in df.columns]
+    rows = df.to_numpy(dtype=object, na_value="").tolist()
+
+    # 数値・bool 列は tolist() の時点で Python の int / float / bool になっている
+    # それ以外（object / 文字列 / 日時 / category など）の列だけを 1セルずつ確認する
+    conv = [j for j, dt in enumerate(df.dtypes) if dt.kind not in "biuf"]
+    if conv:
+        for row in rows:
+            for j in conv:
+                row[j] = _to_cell(row[j])
+    return [header] + rows
+
+
+def _cell_data(v: Any) -> dict:
+    """1セル分の CellData（userEnteredValue）を作る。空文字は「値なし」（= 消去）にする"""
+    if isinstance(v, str):
+        return {"userEnteredValue": {"stringValue": v}} if v != "" else {}
+    if isinstance(v, bool):
+        return {"userEnteredValue": {"boolValue": v}}
+    if isinstance(v, (int, float)) and math.isfinite(v):
+        return {"userEnteredValue": {"numberValue": v}}
+    return {"userEnteredValue": {"stringValue": str(v)}}
+
+
+def _open_sheet(gc: Any, sheet_url: str, sheet_name: str, n_rows: int, n_cols: int, *, refresh: bool) -> list:
+    """
+    書き込み先の [gc, spreadsheet, sheetId, (行数, 列数)] を返す（キャッシュがあれば使う）。
+    シートが無ければ (n_rows, n_cols) の大きさで作る。
+    """
+    key = (sheet_url, sheet_name)
+    entry = None if refresh else _WS_CACHE.get(key)
+    if entry is not None and entry[0] is gc:
+        return entry
+
+    sh = gc.open_by_url(sheet_url)
+    try:
+        ws = sh.worksheet(sheet_name)
+        size = (ws.row_count, ws.col_count)
+    except Exception:
+        ws = sh.add_worksheet(title=sheet_name, rows=n_rows, cols=n_cols)
+        size = (n_rows, n_cols)
+
+    entry = [gc, sh, ws.id, size]
+    _WS_CACHE[key] = entry
+    return entry
+
+
+def _fetch_grid_size(entry: list) -> None:
+    """シートの現在の (行数, 列数) をスプレッドシートのメタデータから取り直し、entry に反映する"""
+    _, sh, sheet_id, _ = entry
+    meta = sh.fetch_sheet_metadata(params={"fields": "sheets.properties(sheetId,gridProperties)"})
+    for sheet in meta.get("sheets", []):
+        props = sheet.get("properties", {})
+        if props.get("sheetId") == sheet_id:
+            grid = props.get("gridProperties", {})
+            entry[3] = (grid.get("rowCount"), grid.get("columnCount"))
+            return
+    # 見つからない（シートが消された等）場合は大きさ不明として、必ずリサイズさせる
+    entry[3] = None
+
+
+def _write_values(
+    entry: list,
+    values: list[list[Any]],
+    n_rows: int,
+    n_cols: int,
+    *,
+    force_resize: bool = True,
+) -> None:
+    """
+    リサイズ + 全セル上書きを 1回の batchUpdate で送る。
+
+    - シートを df の大きさにリサイズ（はみ出した古い行・列はここで消える）
+      force_resize=False のときは、entry の (行数, 列数) が同じならリサイズを省く
+    - 範囲内は空セルも含めて全セルを上書きするので、ws.clear() の往復は不要
+    - 文字列は stringValue として送るため、value_input_option="RAW" と同じく数式等として解釈されない
+    - 送るデータが大きい場合は、行単位で複数回に分けて送る（1回あたり _MAX_REQUEST_BYTES 以下）
+    """
+    _, sh, sheet_id, size = entry
+    requests: list[dict] = []
+    if force_resize or size != (n_rows, n_cols):
+        requests.append(
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": sheet_id,
+                        "gridProperties": {"rowCount": n_rows, "columnCount": n_cols},
+                    },
+                    "fields": "gridProperties.rowCount,gridProperties.columnCount",
+                }
+            }
+        )
+
+    rows = [{"values": [_cell_data(v) for v in row]} for row in values]
+
+    # 1リクエストの大きさには上限（約 10MB）があるため、大きい場合は行で分けて送る
+    # （各行を実際に JSON にした大きさを足し合わせ、_MAX_REQUEST_BYTES を超える手前で区切る。
+    #   長い文字列の行が後ろのほうにあっても上限を超えない）
+    bounds = [0]
+    total = 0
+    for i, row in enumerate(rows):
+        b = len(json.dumps(row)) + 2  # 区切りの ", " の分
+        if total + b > _MAX_REQUEST_BYTES and i > bounds[-1]:
+            bounds.append(i)
+            total = 0
+        total += b
+    bounds.append(len(rows))
+
+    for start, stop in zip(bounds, bounds[1:]):
+        requests.append(
+            {
+                "updateCells": {
+                    "start": {"sheetId": sheet_id, "rowIndex": start, "columnIndex": 0},
+                    "rows": rows[start:stop],
+                    "fields": "userEnteredValue",
+                }
+            }
+        )
+        sh.batch_update({"requests": requests})
+        requests = []
+    entry[3] = (n_rows, n_cols)
+
+
 def write_df_to_gsheet(
     df,
     sheet_url: str,
@@ -135,6 +285,7 @@ def write_df_to_gsheet(
     clear_sheet: bool = True,
     include_index: bool = False,
     normalize: bool = True,
+    refresh: bool = False,
 ) -> None:
     """
     Pandas DataFrame / Series を Google スプレッドシートに書き込む（上書き保存）。
@@ -154,40 +305,45 @@ def write_df_to_gsheet(
     sheet_name:
         書き込み先のシート名。既定は "temporary"。
     clear_sheet:
-        True の場合、書き込み前にシートを消去します（上書き用途向け）。
+        True（既定）の場合、シートを毎回 df の大きさにリサイズしたうえで全セルを上書きします
+        （ws.clear() と同じ結果。消去のための API 呼び出しは別途行いません）。
+        他の人や他のノートブックが行・列を追加していても、はみ出した部分は消えます。
+        False の場合も結果は同じですが、シートの現在の大きさを 1回取得し、
+        df と同じ大きさならリサイズの指示を省きます。
     include_index:
-        True の場合、DataFrame の index をシートに含めます（set_with_dataframe の機能）。
+        True の場合、DataFrame の index をシートに含めます。
     normalize:
         True の場合、Sheets に書き込みやすい形に自動整形します（推奨）。
+    refresh:
+        True の場合、書き込み先シートのキャッシュを使わずに取り直します。
+        （同じ sheet_url / sheet_name への 2回目以降の書き込みは、既定でキャッシュを使います）
     """
     if gc is None:
         gc = get_gspread_client_colab()
 
-    # 1) Open spreadsheet
-    sh = gc.open_by_url(sheet_url)
-
-    # 2) Worksheet を取得（無ければ作る）
-    try:
-        ws = sh.worksheet(sheet_name)
-    except Exception:
-        ws = sh.add_worksheet(title=sheet_name, rows=100, cols=26)
-
-    # 3) シート消去（必要なら）
-    if clear_sheet:
-        ws.clear()
-
-    # 4) DataFrame 整形（必要なら）
+    # 1) DataFrame 整形（必要なら）→ 書き込む値（ヘッダ + 本体）
     df_out = normalize_for_gsheet(df, include_index=include_index) if normalize else (
         df.to_frame(name=(df.name or "count")) if isinstance(df, pd.Series) else df
     )
-
-    # 5) 書き込み
-    set_with_dataframe(
-        ws,
-        df_out,
-        include_index=include_index,
-        include_column_header=True,
-        resize=True,
-    )
+    values = _to_sheet_values(df_out, include_index=include_index)
+    n_rows = max(len(values), 1)
+    n_cols = max(len(values[0]), 1)
+
+    # 2) 書き込み先（spreadsheet / worksheet）を取得し、
+    # 3) リサイズ + 全セル上書きを 1回の batchUpdate で送る
+    # - キャッシュしたシートが消されていた等で失敗した場合は、取り直して 1回だけやり直す
+    key = (sheet_url, sheet_name)
+    cached = not refresh and key in _WS_CACHE and _WS_CACHE[key][0] is gc
+    entry = _open_sheet(gc, sheet_url, sheet_name, n_rows, n_cols, refresh=refresh)
+    try:
+        if cached and not clear_sheet:
+            # キャッシュの大きさは、このプロセスの外で行・列が足されていると古いので取り直す
+            _fetch_grid_size(entry)
+        _write_values(entry, values, n_rows, n_cols, force_resize=clear_sheet)
+    except Exception:
+        if not cached:
+            raise
+        entry = _open_sheet(gc, sheet_url, sheet_name, n_rows, n_cols, refresh=True)
+        _write_values(entry, values, n_rows, n_cols, force_resize=clear_sheet)
 
     print("✅ DataFrame written to Google Sheets:", sheet_url, "/", sheet_name)
@@ -16,6 +16,9 @@
 
 from __future__ import annotations
 
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Optional, Sequence, Union
@@ -25,6 +28,9 @@ import pandas as pd
 
 PathLike = Union[str, Path]
 
+# build_text_df 内部：max_bytes_per_file を超えて読み飛ばしたことを表す印
+_TOO_LARGE = object()
+
 
 def read_text_file(
     path: PathLike,
@@ -47,10 +53,39 @@ def read_text_file(
     Returns
     -------
     str
-        ファイル内容（文字列）。
+        ファイル内容（文字列）。改行は read_text と同じく "\n" にそろえます。
     """
     p = Path(path)
-    return p.read_text(encoding=encoding, errors=errors)
+    # バイト列を 1回で読み、1回でデコードする（テキストモードの逐次デコードより速い）
+    text = p.read_bytes().decode(encoding, errors)
+    if "\r" in text:
+        # read_text（universal newlines）と同じ結果にする
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _iter_text_files(root: Path, exts_norm: tuple[str, ...], recursive: bool):
+    """
+    root 配下を os.scandir で走査し、(フルパス, root からの相対パス) を文字列で返す。
+
+    glob と違い Path オブジェクトを作らず、DirEntry が持つ種別情報を使うため
+    ファイル数が多いフォルダ（Google Drive 上など）でも速い。
+    シンボリックリンクのディレクトリはたどらない。
+    """
+    root_str = str(root)
+    # Path(".") / "a.txt" は "a.txt" になるので、それに合わせる
+    prefix = "" if root_str == "." else os.path.join(root_str, "")
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(prefix + rel_dir if (prefix + rel_dir) else ".") as it:
+            for e in it:
+                rel = rel_dir + e.name
+                if e.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(rel + os.sep)
+                elif e.is_file() and os.path.splitext(e.name)[1].lower() in exts_norm:
+                    yield prefix + rel, rel
 
 
 def build_text_df(
@@ -66,6 +101,8 @@ def build_text_df(
     relpath_col: str = "relpath",
     include_empty: bool = False,
     sort_paths: bool = True,
+    max_workers: int = 8,
+    max_bytes_per_file: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     指定ディレクトリ配下のファイルを走査して、(id, 文書) 形式の DataFrame を作成します。
@@ -94,6 +131,14 @@ def build_text_df(
         空文字（strip して空）の文書も含めるか。既定 False（除外）。
     sort_paths:
         True ならパスでソートしてから ID を振ります（再現性が上がる）。
+    max_workers:
+        ファイル読み込みに使うスレッド数。既定 8。
+        Google Drive 上など 1ファイルごとの待ち時間が長い場合に効きます。
+        1 以下なら逐次読み込みます。
+    max_bytes_per_file:
+        これより大きい（バイト数）ファイルは読み込まずに飛ばします。既定 None（制限なし）。
+        巨大なログファイルなどが 1つ混ざっていて Colab のメモリが尽きるのを防ぎます。
+        飛ばしたファイルがあれば件数を警告します（ID は飛ばさない場合と同じ番号のまま）。
 
     Returns
     -------
@@ -113,18 +158,34 @@ def build_text_df(
     # 先頭ドット無しが混ざっても動くように補正（".txt" 推奨だが親切に）
     exts_norm = tuple(e if e.startswith(".") else f".{e}" for e in exts)
 
-    pattern = "**/*" if recursive else "*"
-    paths = [p for p in root.glob(pattern) if p.is_file() and p.suffix.lower() in exts_norm]
-    if sort_paths:
-        paths = sorted(paths, key=lambda p: str(p))
+    paths = _iter_text_files(root, exts_norm, recursive)
+    paths = sorted(paths) if sort_paths else list(paths)
 
-    rows = []
-    for i, p in enumerate(paths, start=1):
+    def _read(p: str):
         try:
-            text = read_text_file(p, encoding=encoding, errors=errors)
-        except Exception as e:
+            # サイズ確認（stat）も読み込みと同じスレッドで行う（Google Drive 上では stat も遅い）
+            if max_bytes_per_file is not None and os.stat(p).st_size > max_bytes_per_file:
+                return _TOO_LARGE
+            return read_text_file(p, encoding=encoding, errors=errors)
+        except Exception:
             # 1ファイルの失敗で全体を止めない（Colab/教育用途では特に重要）
             # ただし原因追跡のため、例外内容は列に残せるようにしたい場合は拡張してください。
+            return None
+
+    # 読み込みは待ち時間が主なので、スレッドで並行に行う（結果の順序は paths と同じ）
+    if max_workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            texts = list(ex.map(_read, [p for p, _ in paths]))
+    else:
+        texts = [_read(p) for p, _ in paths]
+
+    rows = []
+    n_too_large = 0
+    for i, ((p, rel), text) in enumerate(zip(paths, texts), start=1):
+        if text is None:
+            continue
+        if text is _TOO_LARGE:
+            n_too_large += 1
             continue
 
         if (not include_empty) and (text.strip() == ""):
@@ -135,9 +196,16 @@ def build_text_df(
             text_col: text,
         }
         if path_col is not None:
-            row[path_col] = str(p)
+            row[path_col] = p
         if relpath_col is not None:
-            row[relpath_col] = str(p.relative_to(root))
+            row[relpath_col] = rel
         rows.append(row)
 
+    if n_too_large:
+        warnings.warn(
+            f"build_text_df: max_bytes_per_file={max_bytes_per_file} を超える "
+            f"{n_too_large} 件のファイルを読み飛ばしました",
+            stacklevel=2,
+        )
+
     return pd.DataFrame(rows)
@@ -10,10 +10,28 @@
 
 from __future__ import annotations
 
-from typing import Callable, Iterable, Optional, Tuple, List, Dict, Any
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from operator import methodcaller
+from sys import intern
+import threading
+from typing import Callable, Iterable, Iterator, Optional, Tuple, List, Dict, Any
+import numpy as np
 import pandas as pd
 
 
+# ----------------------------------------------------------------------
+# token_info（extra_col を指定したときの付加情報）
+#   トークンごとに dict を作ると重いので namedtuple にする
+#   属性（info.surface）で読めるほか、info._asdict() で dict にもできる
+# ----------------------------------------------------------------------
+
+JanomeTokenInfo = namedtuple("JanomeTokenInfo", ["surface", "base_form", "reading"])
+SudachiTokenInfo = namedtuple("SudachiTokenInfo", ["surface", "dictionary_form", "normalized_form"])
+FugashiTokenInfo = namedtuple("FugashiTokenInfo", ["surface", "lemma", "reading"])
+
+
 # ----------------------------------------------------------------------
 # 内部ユーティリティ
 # ----------------------------------------------------------------------
@@ -44,7 +62,11 @@ def _compile_pos_filter(
     return keep_set, excl_set
 
 
-def _normalize_stopwords(stopwords) -> set:
+# stopwords=None のときに返す空集合（呼び出しごとに set() を作らない）
+_NO_STOPWORDS: frozenset = frozenset()
+
+
+def _normalize_stopwords(stopwords) -> set | frozenset:
     """
     stopwords を「除外語集合（set[str]）」に正規化する。
 
@@ -58,11 +80,20 @@ def _normalize_stopwords(stopwords) -> set:
 
     注意：
     - str は iterable だが、文字単位に分解しない（単語1つとして扱う）
+    - 要素がすべて str の frozenset は正規化済みとみなし、そのまま返す
+      （同じストップワードを何度も使う場合は frozenset にしておくと速い）
     """
-    result: set = set()
-
     if stopwords is None:
-        return result
+        return _NO_STOPWORDS
+
+    # 要素がすべて str の frozenset は「正規化済み」とみなしてそのまま使う（呼び出し間で使い回せる）
+    # str 以外が混ざる場合は set などと同じく正規化する（容器の型で結果を変えない）
+    if isinstance(stopwords, frozenset):
+        if all(isinstance(sw, str) for sw in stopwords):
+            return stopwords
+        return frozenset(_normalize_stopwords(set(stopwords)))
+
+    result: set = set()
 
     # str は最優先（iterable 扱いしない）
     if isinstance(stopwords, str):
@@ -90,6 +121,57 @@ def _normalize_stopwords(stopwords) -> set:
         return result
 
 
+def _token_mask(
+    df: pd.DataFrame,
+    *,
+    keep_set: Optional[set],
+    excl_set: Optional[set],
+    sw_set: set | frozenset,
+    word_col: str = "word",
+    caller: str = "filter_tokens_df",
+) -> Optional[np.ndarray]:
+    """
+    品詞・ストップワードの条件を 1つの bool 配列にまとめる（条件がなければ None）
+
+    pos 列・word 列が category 型の場合は、文字列の比較を種類数だけで済ませる。
+    """
+    mask = None
+    if keep_set is not None or excl_set is not None:
+        if "pos" not in df.columns:
+            raise KeyError(f"{caller}: DataFrame に 'pos' 列がありません")
+        pos = df["pos"]
+        if isinstance(pos.dtype, pd.CategoricalDtype):
+            # category 型：品詞の種類（数十個）だけで判定し、codes で全行に展開する
+            cats = pos.cat.categories
+            ok = np.ones(len(cats), dtype=bool)
+            if keep_set is not None:
+                ok &= cats.isin(keep_set)
+            if excl_set is not None:
+                ok &= ~cats.isin(excl_set)
+            # codes == -1（欠損）は末尾の値を参照させる（object 列の isin と同じ扱い）
+            mask = np.append(ok, keep_set is None)[pos.cat.codes.to_numpy()]
+        else:
+            if keep_set is not None:
+                mask = pos.isin(keep_set).to_numpy()
+            if excl_set is not None:
+                m = ~pos.isin(excl_set).to_numpy()
+                mask = m if mask is None else (mask & m)
+    if sw_set:
+        if word_col not in df.columns:
+            raise KeyError(
+                f"{caller}: stopwords が指定されましたが DataFrame に {word_col!r} 列がありません"
+            )
+        words = df[word_col]
+        if isinstance(words.dtype, pd.CategoricalDtype):
+            # category 型：語彙（categories）だけで判定し、codes で全行に展開する
+            hit = np.append(words.cat.categories.isin(sw_set), False)
+            m = ~hit[words.cat.codes.to_numpy()]
+        else:
+            m = ~words.isin(sw_set).to_numpy()
+        mask = m if mask is None else (mask & m)
+    return mask
+
+
 # ----------------------------------------------------------------------
 # 公開ユーティリティ（tokenize 後の操作）
 # ----------------------------------------------------------------------
@@ -140,18 +222,15 @@ def filter_tokens_df(
         strict=strict,
     )
 
-    s = df
-    if keep_set is not None:
-        s = s[s["pos"].isin(keep_set)]
-    if excl_set is not None:
-        s = s[~s["pos"].isin(excl_set)]
-
-    if stopwords is not None and not s.empty:
-        if "word" not in s.columns:
-            raise KeyError("filter_tokens_df: stopwords が指定されましたが DataFrame に 'word' 列がありません")
-        sw_set = _normalize_stopwords(stopwords)
-        if sw_set:
-            s = s[~s["word"].isin(sw_set)]
+    # 品詞・ストップワードの条件を 1つの bool 配列にまとめ、行の抽出は 1回だけ行う
+    # （条件ごとに DataFrame を切り出すと、そのたびに全列のコピーが走る）
+    mask = _token_mask(
+        df,
+        keep_set=keep_set,
+        excl_set=excl_set,
+        sw_set=_normalize_stopwords(stopwords),
+    )
+    s = df if mask is None else df[mask]
 
     return s if keep_original_index else s.reset_index(drop=True)
 
@@ -165,36 +244,53 @@ def tokenize_text_janome(
     *,
     tokenizer,
     use_base_form: bool = True,
-    extra_col: Optional[str] = "token_info",
-) -> List[Tuple[str, str, Optional[Dict[str, Any]]]]:
+    extra_col: Optional[str] = None,
+    pos_keep: Optional[Iterable[str]] = None,
+    pos_exclude: Optional[Iterable[str]] = None,
+) -> List[Tuple[str, str, Optional[JanomeTokenInfo]]]:
     """
     Janome による 1 テキスト分のトークナイズ
 
+    Parameters
+    ----------
+    pos_keep, pos_exclude : set[str] | None, default None
+        品詞（大分類）フィルタ。落ちるトークンは token_info も作らずにその場で捨てる。
+        トークンごとに `in` で判定するので set / frozenset で渡すこと。
+
     Returns
     -------
     list of (word, pos, token_info)
     """
-    if text is None:
+    # 欠損（None / NaN / pd.NA）は空扱い（str() すると "nan" という語になってしまう）
+    if text is None or text is pd.NA or (isinstance(text, float) and text != text):
         return []
 
     s = str(text).strip()
     if s == "":
         return []
 
-    records: List[Tuple[str, str, Optional[Dict[str, Any]]]] = []
+    # 品詞は intern して、数十種類の文字列オブジェクトを全トークンで共有する（pos 列のメモリ削減）
+    if extra_col is None and pos_keep is None and pos_exclude is None:
+        # token_info も品詞フィルタもない場合（既定）は、分岐も append もない内包表記で一気に作る
+        if use_base_form:
+            return [(t.base_form, intern(t.part_of_speech.partition(",")[0]), None) for t in tokenizer.tokenize(s)]
+        return [(t.surface, intern(t.part_of_speech.partition(",")[0]), None) for t in tokenizer.tokenize(s)]
+
+    records: List[Tuple[str, str, Optional[JanomeTokenInfo]]] = []
     for token in tokenizer.tokenize(s):
+        # 品詞（大分類）：フィルタで落ちるトークンはここで捨てる
+        pos = intern(token.part_of_speech.partition(",")[0])
+        if pos_keep is not None and pos not in pos_keep:
+            continue
+        if pos_exclude is not None and pos in pos_exclude:
+            continue
+
         # word: 原形（base_form） or 表層形（surface）
         word = token.base_form if use_base_form else token.surface
-        # 品詞（大分類）
-        pos = token.part_of_speech.split(",")[0]
 
         token_info = None
         if extra_col is not None:
-            token_info = {
-                "surface": token.surface,
-                "base_form": token.base_form,
-                "reading": token.reading,
-            }
+            token_info = JanomeTokenInfo(token.surface, token.base_form, token.reading)
 
         records.append((word, pos, token_info))
 
@@ -205,6 +301,45 @@ def tokenize_text_janome(
 # 1 テキスト用 tokenizer（Sudachi）
 # ----------------------------------------------------------------------
 
+# "A"/"B"/"C" -> SplitMode（初回に 1回だけ作る）
+_SUDACHI_MODE_CACHE: Dict[str, Any] = {}
+
+
+def _sudachi_split_mode(split_mode: str):
+    """split_mode 文字列を SplitMode に変換する（不明な値は C）"""
+    if not _SUDACHI_MODE_CACHE:
+        try:
+            from sudachipy import SplitMode
+        except ImportError as e:
+            raise ImportError(
+                "SudachiPy が見つかりません。Sudachi を使う場合は "
+                "`pip install sudachipy sudachidict_core` を実行してください。"
+            ) from e
+        _SUDACHI_MODE_CACHE.update({"A": SplitMode.A, "B": SplitMode.B, "C": SplitMode.C})
+    return _SUDACHI_MODE_CACHE.get(str(split_mode).upper(), _SUDACHI_MODE_CACHE["C"])
+
+# word_form の別名 -> Morpheme のメソッド名
+_SUDACHI_WORD_FORMS: Dict[str, str] = {
+    **dict.fromkeys(("dictionary", "dict", "base", "lemma"), "dictionary_form"),
+    **dict.fromkeys(("surface", "orig", "original"), "surface"),
+    **dict.fromkeys(("normalized", "normal", "norm"), "normalized_form"),
+}
+
+
+def _sudachi_word_getter(word_form: Optional[str], use_base_form: bool) -> Callable[[Any], str]:
+    """word_form / use_base_form から「形態素 -> word」の関数を 1回だけ決める"""
+    if word_form is None:
+        return methodcaller("dictionary_form" if use_base_form else "surface")
+
+    method = _SUDACHI_WORD_FORMS.get(str(word_form).lower())
+    if method is not None:
+        return methodcaller(method)
+    raise ValueError(
+        f"tokenize_text_sudachi: invalid word_form={word_form!r}. "
+        "Use 'dictionary'/'surface'/'normalized' (or omit)."
+    )
+
+
 def tokenize_text_sudachi(
     text: str,
     *,
@@ -212,8 +347,10 @@ def tokenize_text_sudachi(
     split_mode: str = "C",
     word_form: Optional[str] = None,
     use_base_form: bool = True,
-    extra_col: Optional[str] = "token_info",
-) -> List[Tuple[str, str, Optional[Dict[str, Any]]]]:
+    extra_col: Optional[str] = None,
+    pos_keep: Optional[Iterable[str]] = None,
+    pos_exclude: Optional[Iterable[str]] = None,
+) -> List[Tuple[str, str, Optional[SudachiTokenInfo]]]:
     """
     SudachiPy による 1 テキスト分のトークナイズ
 
@@ -230,62 +367,104 @@ def tokenize_text_sudachi(
     use_base_form : bool
         word_form が None の場合のみ参照されます。
         True なら dictionary_form、False なら surface を返します。
-    extra_col : str | None
-        None の場合 token_info を作りません（高速化・軽量化したい場合）
+    extra_col : str | None, default None
+        None（既定）の場合 token_info を作りません（形態素ごとの追加の呼び出しを省く）
+    pos_keep, pos_exclude : set[str] | None, default None
+        品詞（大分類）フィルタ。落ちる形態素は word / token_info を作らずにその場で捨てる。
+        形態素ごとに `in` で判定するので set / frozenset で渡すこと。
 
     Returns
     -------
     list of (word, pos, token_info)
     """
-    if text is None:
+    # 欠損（None / NaN / pd.NA）は空扱い（str() すると "nan" という語になってしまう）
+    if text is None or text is pd.NA or (isinstance(text, float) and text != text):
         return []
 
     s = str(text).strip()
     if s == "":
         return []
 
-    try:
-        from sudachipy import SplitMode
-    except ImportError as e:
-        raise ImportError(
-            "SudachiPy が見つかりません。Sudachi を使う場合は "
-            "`pip install sudachipy sudachidict_core` を実行してください。"
-        ) from e
-
-    mode_map = {
-        "A": SplitMode.A,
-        "B": SplitMode.B,
-        "C": SplitMode.C,
-    }
-    mode = mode_map.get(str(split_mode).upper(), SplitMode.C)
+    mode = _sudachi_split_mode(split_mode)
+    get_word = _sudachi_word_getter(word_form, use_base_form)
 
-    records: List[Tuple[str, str, Optional[Dict[str, Any]]]] = []
-    for m in tokenizer.tokenize(s, mode):
-        if word_form is None:
-            word = m.dictionary_form() if use_base_form else m.surface()
-        else:
-            wf = str(word_form).lower()
-            if wf in {"dictionary", "dict", "base", "lemma"}:
-                word = m.dictionary_form()
-            elif wf in {"surface", "orig", "original"}:
-                word = m.surface()
-            elif wf in {"normalized", "normal", "norm"}:
-                word = m.normalized_form()
-            else:
-                raise ValueError(
-                    f"tokenize_text_sudachi: invalid word_form={word_form!r}. "
-                    "Use 'dictionary'/'surface'/'normalized' (or omit)."
-                )
+    if extra_col is None and pos_keep is None and pos_exclude is None:
+        # token_info も品詞フィルタもない場合（既定）は、内包表記で一気に作る
+        return [(get_word(m), m.part_of_speech()[0], None) for m in tokenizer.tokenize(s, mode)]
 
+    records: List[Tuple[str, str, Optional[SudachiTokenInfo]]] = []
+    for m in tokenizer.tokenize(s, mode):
         pos = m.part_of_speech()[0]
+        if pos_keep is not None and pos not in pos_keep:
+            continue
+        if pos_exclude is not None and pos in pos_exclude:
+            continue
+        word = get_word(m)
 
         token_info = None
         if extra_col is not None:
-            token_info = {
-                "surface": m.surface(),
-                "dictionary_form": m.dictionary_form(),
-                "normalized_form": m.normalized_form(),
-            }
+            token_info = SudachiTokenInfo(m.surface(), m.dictionary_form(), m.normalized_form())
+
+        records.append((word, pos, token_info))
+
+    return records
+
+
+# ----------------------------------------------------------------------
+# 1 テキスト用 tokenizer（fugashi / MeCab）
+# ----------------------------------------------------------------------
+
+def tokenize_text_fugashi(
+    text: str,
+    *,
+    tokenizer,
+    use_base_form: bool = True,
+    extra_col: Optional[str] = None,
+    pos_keep: Optional[Iterable[str]] = None,
+    pos_exclude: Optional[Iterable[str]] = None,
+) -> List[Tuple[str, str, Optional[FugashiTokenInfo]]]:
+    """
+    fugashi（MeCab + UniDic）による 1 テキスト分のトークナイズ
+
+    解析は C 実装の MeCab が行うため、Janome より大幅に速い。
+
+    Parameters
+    ----------
+    tokenizer : fugashi.Tagger
+        UniDic 系の辞書（unidic-lite / unidic）を使う Tagger
+    use_base_form : bool
+        True なら語彙素（lemma。辞書にない語は表層形）、False なら表層形を返す。
+    extra_col : str | None, default None
+        None（既定）の場合 token_info を作らない。
+    pos_keep, pos_exclude : set[str] | None, default None
+        品詞（大分類 = pos1）フィルタ。tokenize_text_janome と同じ。
+
+    Returns
+    -------
+    list of (word, pos, token_info)
+    """
+    if text is None or text is pd.NA or (isinstance(text, float) and text != text):
+        return []
+
+    s = str(text).strip()
+    if s == "":
+        return []
+
+    records: List[Tuple[str, str, Optional[FugashiTokenInfo]]] = []
+    for node in tokenizer(s):
+        f = node.feature
+        pos = intern(f.pos1)
+        if pos_keep is not None and pos not in pos_keep:
+            continue
+        if pos_exclude is not None and pos in pos_exclude:
+            continue
+
+        surface = node.surface
+        word = (f.lemma or surface) if use_base_form else surface
+
+        token_info = None
+        if extra_col is not None:
+            token_info = FugashiTokenInfo(surface, f.lemma, f.kana)
 
         records.append((word, pos, token_info))
 
@@ -296,6 +475,144 @@ def tokenize_text_sudachi(
 # DataFrame 用 tokenizer（入口）
 # ----------------------------------------------------------------------
 
+def _check_engine(engine: str) -> str:
+    eng = str(engine).lower()
+    if eng not in ("janome", "sudachi", "fugashi"):
+        raise ValueError(f"tokenize_df: Unknown engine={engine!r}")
+    return eng
+
+
+# engine -> 既定の tokenizer（辞書の読み込みは重いので、スレッドごとに 1回だけ作る）
+# Janome / Sudachi の tokenizer はスレッドセーフではないため、スレッド間では共有しない
+_DEFAULT_TOKENIZERS = threading.local()
+
+
+def _default_tokenizer(eng: str):
+    """tokenizer 引数が None のときに使う tokenizer を返す（初回だけ生成してキャッシュ）"""
+    cache: Optional[Dict[str, Any]] = getattr(_DEFAULT_TOKENIZERS, "by_engine", None)
+    if cache is None:
+        cache = _DEFAULT_TOKENIZERS.by_engine = {}
+    tokenizer = cache.get(eng)
+    if tokenizer is None:
+        if eng == "janome":
+            from janome.tokenizer import Tokenizer
+            tokenizer = Tokenizer()
+        elif eng == "fugashi":
+            from fugashi import Tagger
+            tokenizer = Tagger()
+        else:
+            from sudachipy import dictionary
+            tokenizer = dictionary.Dictionary().create()
+        cache[eng] = tokenizer
+    return tokenizer
+
+
+def _make_tokenize_text_fn(
+    engine: str,
+    tokenizer,
+    use_base_form: bool,
+    extra_col: Optional[str],
+    pos_keep: Optional[set] = None,
+    pos_exclude: Optional[set] = None,
+) -> Callable[[str], List[Tuple[str, str, Any]]]:
+    """engine / tokenizer から 1テキスト用の関数を組み立てる（tokenizer が None なら既定のものを使う）"""
+    eng = _check_engine(engine)
+    if tokenizer is None:
+        tokenizer = _default_tokenizer(eng)
+
+    if eng in ("janome", "fugashi"):
+        text_fn = tokenize_text_janome if eng == "janome" else tokenize_text_fugashi
+
+        def _fn(t: str):
+            return text_fn(
+                t,
+                tokenizer=tokenizer,
+                use_base_form=use_base_form,
+                extra_col=extra_col,
+                pos_keep=pos_keep,
+                pos_exclude=pos_exclude,
+            )
+        return _fn
+
+    def _fn(t: str):
+        return tokenize_text_sudachi(
+            t,
+            tokenizer=tokenizer,
+            split_mode="C",
+            word_form=None,
+            use_base_form=use_base_form,
+            extra_col=extra_col,
+            pos_keep=pos_keep,
+            pos_exclude=pos_exclude,
+        )
+    return _fn
+
+
+def _tokenize_texts(
+    fn: Callable[[str], List[Tuple[str, str, Any]]],
+    texts,
+    with_info: bool,
+) -> Tuple[List[int], List[str], List[str], Optional[List[Any]]]:
+    """
+    複数テキストをトークナイズし、(文書ごとのトークン数, word 列, pos 列, token_info 列) を返す。
+    （トークンごとの tuple ではなく列ごとのリストにまとめる）
+    """
+    per_doc = [t if type(t) is list else list(t) for t in map(fn, texts)]
+    lengths = [len(t) for t in per_doc]
+    flat = list(chain.from_iterable(per_doc))
+    del per_doc
+    words = [t[0] for t in flat]
+    poss = [t[1] for t in flat]
+    infos = [t[2] for t in flat] if with_info else None
+    return lengths, words, poss, infos
+
+
+# 長い本文を分けるときの区切り（この文字の直後で切る。前にあるものほど優先）
+_CHUNK_BREAKS = ("\n", "。", "！", "？", "!", "?")
+
+
+def _split_long_text(text: str, max_chars: int) -> List[str]:
+    """
+    長い本文を max_chars 文字以下の断片に分ける（改行・文末記号の直後で切る）。
+    区切りが見つからない区間は max_chars 文字で機械的に切る。
+    """
+    pieces = []
+    start = 0
+    n = len(text)
+    while n - start > max_chars:
+        end = start + max_chars
+        cut = -1
+        for ch in _CHUNK_BREAKS:
+            cut = text.rfind(ch, start, end)
+            if cut >= 0:
+                break
+        end = cut + 1 if cut >= 0 else end
+        pieces.append(text[start:end])
+        start = end
+    pieces.append(text[start:])
+    return pieces
+
+
+# 並列処理（n_jobs > 1）用：各ワーカープロセスが持つ 1テキスト関数
+_WORKER_TOKENIZE_TEXT_FN: Optional[Callable[[str], List[Tuple[str, str, Any]]]] = None
+_WORKER_WITH_INFO: bool = False
+
+
+def _init_tokenize_worker(engine, use_base_form, extra_col, tokenize_text_fn, pos_keep, pos_exclude) -> None:
+    global _WORKER_TOKENIZE_TEXT_FN, _WORKER_WITH_INFO
+    if tokenize_text_fn is None:
+        tokenize_text_fn = _make_tokenize_text_fn(
+            engine, None, use_base_form, extra_col, pos_keep, pos_exclude
+        )
+    _WORKER_TOKENIZE_TEXT_FN = tokenize_text_fn
+    _WORKER_WITH_INFO = bool(extra_col)
+
+
+def _tokenize_batch_in_worker(texts):
+    # 列ごとのリストで返す（トークンごとの tuple を pickle しないので、プロセス間の受け渡しが軽い）
+    return _tokenize_texts(_WORKER_TOKENIZE_TEXT_FN, texts, _WORKER_WITH_INFO)
+
+
 def tokenize_df(
     df: pd.DataFrame,
     *,
@@ -308,7 +625,14 @@ def tokenize_df(
     pos_keep: Optional[Iterable[str]] = None,
     pos_exclude: Optional[Iterable[str]] = None,
     stopwords: Optional[Iterable[str]] = None,
-    extra_col: Optional[str] = "token_info",
+    extra_col: Optional[str] = None,
+    n_jobs: int = 1,
+    chunk_size: Optional[int] = None,
+    dedupe: bool = True,
+    pos_category: bool = False,
+    word_category: bool = False,
+    max_chunk_chars: int = 0,
+    arrow_strings: bool = False,
 ) -> pd.DataFrame:
     """
     テキスト DataFrame を縦持ち token DataFrame に変換する（入口関数）
@@ -325,8 +649,8 @@ def tokenize_df(
         文書ID列名
     text_col : str
         テキスト列名
-    engine : {"janome","sudachi"}
-        形態素解析エンジン（デフォルトは janome）
+    engine : {"janome","sudachi","fugashi"}
+        形態素解析エンジン（デフォルトは janome。fugashi は MeCab ベースで高速）
     tokenizer : optional
         エンジンの tokenizer を外部で生成して渡す（高速化・使い回し）
     tokenize_text_fn : callable, optional
@@ -339,8 +663,41 @@ def tokenize_df(
         ※教育用途では、まず無指定で tokenize して、後で filter_tokens_df で段階的に調整するのがおすすめ
     stopwords : iterable[str], optional
         除外語リスト（word で判定）
-    extra_col : str | None
-        token_info 列名。None の場合は token_info を作らない（軽量化）
+    extra_col : str | None, default None
+        token_info 列名。None（既定）の場合は token_info を作らない（軽量化）。
+        表層形・読みなどの付加情報が必要な場合だけ "token_info" などを指定する。
+    n_jobs : int, default 1
+        2 以上の場合、文書をプロセスプールに分けて並列にトークナイズする（出力順は同じ）。
+        tokenizer は各ワーカーが自前で生成するため、tokenizer 引数は使われない。
+        tokenize_text_fn を渡す場合は、pickle できるモジュールレベル関数にすること。
+        ※ spawn 方式（Windows / macOS）の .py スクリプトから呼ぶ場合は、
+           呼び出しを `if __name__ == "__main__":` の下に置くこと（Colab / Linux は不要）。
+    chunk_size : int | None, default None
+        n_jobs > 1 のとき、1回にワーカーへ渡す文書数。None の場合は n_jobs×4 個程度の
+        まとまりになるように決める。文書の長さのばらつきが大きい場合は小さめにすると偏りが減る。
+    dedupe : bool, default True
+        True の場合、同じ本文は 1回だけトークナイズして結果を使い回す
+        （定型文・見出し・重複記事の多いコーパスで速い）。出力は False の場合と同じ。
+        重複がなければ展開の手間もかからない。
+        token_info を作る場合、同じ本文の文書間で token_info のオブジェクトは共有される
+        （tokenize_text_fn が dict を返す場合、書き換えると他の文書にも波及する）。
+    pos_category : bool, default False
+        True の場合、pos 列を category 型にする（品詞は数十種類しかないため、
+        メモリが減り、filter_tokens_df / tokens_to_text の品詞フィルタが速くなる）。
+        ※ category 型の value_counts() は、出現しない品詞も 0 件として表示する。
+    word_category : bool, default False
+        True の場合、word 列も category 型（語彙 + 整数コード）にする。語は少数の頻出語が
+        大半を占めるため、大きなコーパスではメモリが大きく減り、stopwords の判定や
+        groupby("word") も語彙の数だけで済む。pos_category と同じ注意がある。
+    max_chunk_chars : int, default 0
+        1 以上の場合、これより長い本文を改行・文末記号（。！？）の直後で断片に分け、
+        断片ごとにトークナイズして文書単位に連結する。n_jobs と併用すると、
+        極端に長い文書 1つが並列処理全体の足を引っ張らなくなる。
+        ※ 断片の境目（文末）をまたぐ語はないが、境目の空白トークンは落ちることがある。
+    arrow_strings : bool, default False
+        True の場合、category でない word 列・pos 列を Arrow 文字列型
+        （"string[pyarrow]"）にする。object 型より大幅にメモリが減る。要 pyarrow。
+        ※ pandas 3 では pyarrow があれば既定の文字列型がすでに Arrow ベース。
 
     Returns
     -------
@@ -358,68 +715,173 @@ def tokenize_df(
             f"存在する列: {list(df.columns)}"
         )
 
+    if arrow_strings:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "arrow_strings=True には pyarrow が必要です。"
+                "`pip install pyarrow` を実行してください。"
+            ) from e
+
+    texts = df[text_col].to_numpy()
+    with_info = bool(extra_col)
+
+    # 品詞フィルタは組み込みの tokenizer の中で先に掛ける（落ちるトークンを作らない）
+    # tokenize_text_fn を差し替えた場合は、従来どおり最後に filter_tokens_df で落とす
+    keep_set, excl_set = _compile_pos_filter(pos_keep, pos_exclude, strict=True)
     if tokenize_text_fn is None:
-        eng = str(engine).lower()
+        keep_set = frozenset(keep_set) if keep_set is not None else None
+        excl_set = frozenset(excl_set) if excl_set is not None else None
+        pos_keep = pos_exclude = None
+    else:
+        keep_set = excl_set = None
+
+    codes = None
+    if dedupe:
+        # 同じ本文は 1回だけトークナイズし、あとで文書ごとに展開する
+        # （重複がなければ factorize の結果は元の並びと同じなので、展開は不要）
+        u_codes, u_texts = pd.factorize(texts, use_na_sentinel=False)
+        if len(u_texts) < len(texts):
+            codes, texts = u_codes, u_texts
+
+    owner = None
+    if max_chunk_chars > 0:
+        # 長い本文は断片に分ける（owner[k] = 断片 k の元の本文の位置）
+        pieces: List[Any] = []
+        piece_owner: List[int] = []
+        for i, t in enumerate(texts):
+            if isinstance(t, str) and len(t) > max_chunk_chars:
+                parts = _split_long_text(t, max_chunk_chars)
+                pieces.extend(parts)
+                piece_owner.extend([i] * len(parts))
+            else:
+                pieces.append(t)
+                piece_owner.append(i)
+        if len(pieces) > len(texts):
+            n_texts = len(texts)
+            texts, owner = pieces, np.asarray(piece_owner, dtype=np.int64)
+
+    if n_jobs > 1 and len(texts) > 1:
+        # 並列：文書を n_jobs×4 個程度のまとまりに分けてワーカーに渡す（出力順は入力順のまま）
+        # tokenizer は pickle できないため、各ワーカーが initializer で自前に作る
+        # （tokenizer 引数は使わない。tokenize_text_fn はモジュールレベル関数にすること）
+        if tokenize_text_fn is None:
+            _check_engine(engine)
+        size = chunk_size if chunk_size else max(1, -(-len(texts) // (4 * n_jobs)))
+        batches = [texts[i:i + size] for i in range(0, len(texts), size)]
+        lengths: List[int] = []
+        words: List[str] = []
+        poss: List[str] = []
+        infos: Optional[List[Any]] = [] if with_info else None
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_tokenize_worker,
+            initargs=(engine, use_base_form, extra_col, tokenize_text_fn, keep_set, excl_set),
+        ) as executor:
+            for b_lengths, b_words, b_poss, b_infos in executor.map(_tokenize_batch_in_worker, batches):
+                lengths.extend(b_lengths)
+                words.extend(b_words)
+                poss.extend(b_poss)
+                if infos is not None:
+                    infos.extend(b_infos)
+    else:
+        if tokenize_text_fn is None:
+            tokenize_text_fn = _make_tokenize_text_fn(
+                engine, tokenizer, use_base_form, extra_col, keep_set, excl_set
+            )
+        lengths, words, poss, infos = _tokenize_texts(tokenize_text_fn, texts, with_info)
+
+    if owner is not None:
+        # 断片のトークンは本文順に並んでいるので、トークン数だけ本文ごとに合算すればよい
+        lengths = np.bincount(owner, weights=lengths, minlength=n_texts).astype(np.int64)
+
+    if codes is not None:
+        # ユニーク本文ごとの結果を、元の文書の並びに展開する
+        u_lengths = np.asarray(lengths, dtype=np.int64)
+        u_starts = np.cumsum(u_lengths) - u_lengths
+        lengths = u_lengths[codes]
+        starts = np.cumsum(lengths) - lengths
+        take = (np.repeat(u_starts[codes] - starts, lengths) + np.arange(lengths.sum())).tolist()
+        words = [words[i] for i in take]
+        poss = [poss[i] for i in take]
+        if infos is not None:
+            infos = [infos[i] for i in take]
+
+    # 文書ID はトークン数だけ np.repeat で複製する（トークンごとの append をしない）
+    ids = np.repeat(df[id_col].to_numpy(), np.asarray(lengths, dtype=np.int64))
+
+    cols: Dict[str, Any] = {
+        id_col: ids,
+        "word": pd.Categorical(words) if word_category else words,
+        "pos": pd.Categorical(poss) if pos_category else poss,
+    }
+    if arrow_strings:
+        # Arrow 文字列型：1セルごとに Python の str を持つ object 列よりずっと小さい
+        if not word_category:
+            cols["word"] = pd.array(words, dtype="string[pyarrow]")
+        if not pos_category:
+            cols["pos"] = pd.array(poss, dtype="string[pyarrow]")
+    if extra_col:
+        cols[extra_col] = infos
+    out = pd.DataFrame(cols)
 
-        if eng == "janome":
-            if tokenizer is None:
-                from janome.tokenizer import Tokenizer
-                tokenizer = Tokenizer()
-
-            def _fn(t: str):
-                return tokenize_text_janome(
-                    t,
-                    tokenizer=tokenizer,
-                    use_base_form=use_base_form,
-                    extra_col=extra_col,
-                )
-            tokenize_text_fn = _fn
-
-        elif eng == "sudachi":
-            if tokenizer is None:
-                from sudachipy import dictionary
-                tokenizer = dictionary.Dictionary().create()
-
-            def _fn(t: str):
-                return tokenize_text_sudachi(
-                    t,
-                    tokenizer=tokenizer,
-                    split_mode="C",
-                    word_form=None,
-                    use_base_form=use_base_form,
-                    extra_col=extra_col,
-                )
-            tokenize_text_fn = _fn
+    # stopwords はここでは除外しない（filter_tokens_df に一本化）
 
-        else:
-            raise ValueError(f"tokenize_df: Unknown engine={engine!r}")
+    if out.empty:
+        return out
 
-    records: List[Dict[str, Any]] = []
-    for _, row in df.iterrows():
-        doc_id = row[id_col]
-        text = row[text_col]
+    # 残りの条件（ストップワード、差し替え時の品詞）は 1回の抽出でまとめて落とす（index も振り直される）
+    return filter_tokens_df(
+        out,
+        pos_keep=pos_keep,
+        pos_exclude=pos_exclude,
+        stopwords=stopwords,
+        strict=True,
+    )
 
-        tokens = tokenize_text_fn(text)
-        for word, pos, token_info in tokens:
-            rec = {id_col: doc_id, "word": word, "pos": pos}
-            if extra_col:
-                rec[extra_col] = token_info
-            records.append(rec)
 
-    out = pd.DataFrame(records)
+def iter_tokenize_df(
+    df: pd.DataFrame | Iterable[pd.DataFrame],
+    *,
+    chunksize: int = 10_000,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """
+    tokenize_df を chunksize 文書ずつ実行し、token DataFrame を順に返すジェネレータ
 
-    # stopwords はここでは除外しない（filter_tokens_df に一本化）
+    全文書ぶんの token DataFrame を一度に作らないので、語頻度の集計などを
+    少しずつ進めたい場合にメモリを抑えられる。最初の結果もすぐに得られる。
+    入力も DataFrame の iterable（pd.read_csv(..., chunksize=...) の戻り値など）で
+    渡せるので、入力・出力とも全体を持たずに処理できる。
 
-    if not out.empty:
-        out = filter_tokens_df(
-            out,
-            pos_keep=pos_keep,
-            pos_exclude=pos_exclude,
-            stopwords=stopwords,
-            strict=True,
-        )
+    Parameters
+    ----------
+    df : pandas.DataFrame or iterable of pandas.DataFrame
+        入力 DataFrame（文書単位）。iterable の場合は 1つずつ取り出して
+        さらに chunksize 文書ずつに分けて処理する
+    chunksize : int, default 10_000
+        1回に tokenize する文書数
+    **kwargs
+        tokenize_df の引数（id_col, text_col, engine, pos_keep, stopwords など）
+
+    Yields
+    ------
+    pandas.DataFrame
+        tokenize_df と同じ形式（index はまとまりごとに 0 から振り直される）
 
-    return out.reset_index(drop=True)
+    Notes
+    -----
+    - dedupe はまとまりの中でだけ効く（まとまりをまたぐ重複は再度トークナイズする）
+    - n_jobs を指定すると、まとまりごとにプロセスプールを作り直すので、
+      chunksize は大きめ（n_jobs×数千文書以上）にすること
+    """
+    if chunksize < 1:
+        raise ValueError(f"iter_tokenize_df: chunksize は 1 以上にしてください（chunksize={chunksize!r}）")
+    frames = (df,) if isinstance(df, pd.DataFrame) else df
+    for frame in frames:
+        for start in range(0, len(frame), chunksize):
+            yield tokenize_df(frame.iloc[start:start + chunksize], **kwargs)
 
 
 # ----------------------------------------------------------------------
@@ -445,7 +907,7 @@ def tokens_to_text(
     これは WordCloud など「コーパス全体を 1 つの入力文字列として扱う」用途を想定している。
 
     per_doc=True を指定した場合は、文書IDごとに結合した DataFrame を返す。
-    （columns: [id_col, "text"]）
+    （columns: [id_col, "text"]、行の順序は入力に文書IDが現れた順）
 
     Parameters
     ----------
@@ -458,10 +920,11 @@ def tokens_to_text(
     sep : str
         トークン間の区切り文字。
     pos_keep, pos_exclude : iterable[str], optional
-        品詞（大分類）フィルタ。filter_tokens_df に委譲する。
+        品詞（大分類）フィルタ。filter_tokens_df と同じ条件。
     stopwords : optional
-        除外語（word_col で判定）。filter_tokens_df に委譲する。
+        除外語（word_col で判定）。filter_tokens_df と同じ形式で、
         str / list / tuple / set / pandas.Series / pandas.Index / 入れ子を受け付ける。
+        何度も呼ぶ場合は frozenset にして渡すと、毎回の正規化を省ける。
     per_doc : bool, default False
         True の場合、文書ごとの text を返す。False の場合、全体を 1 本に結合した str を返す。
     strict : bool, default True
@@ -473,29 +936,180 @@ def tokens_to_text(
         per_doc=False: str（全体を 1 本に結合）
         per_doc=True : pandas.DataFrame（文書ごとに結合）
     """
-    s = filter_tokens_df(
-        df,
+    # filter_tokens_df と同じ条件を 1つの bool 配列にまとめ、必要な列だけ取り出す
+    # （中間の DataFrame を作らない）
+    keep_set, excl_set = _compile_pos_filter(
         pos_keep=pos_keep,
         pos_exclude=pos_exclude,
-        stopwords=stopwords,
         strict=strict,
     )
+    mask = _token_mask(
+        df,
+        keep_set=keep_set,
+        excl_set=excl_set,
+        sw_set=_normalize_stopwords(stopwords),
+        word_col=word_col,
+        caller="tokens_to_text",
+    )
 
     if per_doc:
-        return (
-            s.groupby(id_col)[word_col]
-            .apply(lambda xs: sep.join(xs))
-            .reset_index(name="text")
+        # groupby を使わず、(文書ID, 語) を 1回なめて文書ごとのリストに振り分ける
+        # 文書の並びは入力順（最初に現れた順）。文書ID が欠損の行は groupby と同じく除く
+        ids = df[id_col].to_numpy()
+        words = df[word_col].to_numpy()
+        keep = pd.notna(ids)
+        if mask is not None:
+            keep &= mask
+        if not keep.all():
+            ids = ids[keep]
+            words = words[keep]
+
+        by_doc: Dict[Any, List[Any]] = defaultdict(list)
+        for doc_id, w in zip(ids.tolist(), words.tolist()):
+            by_doc[doc_id].append(w)
+
+        return pd.DataFrame(
+            {
+                id_col: pd.Series(list(by_doc), dtype=df[id_col].dtype),
+                "text": [sep.join(v) for v in by_doc.values()],
+            }
         )
 
     # 全トークンを 1 本に結合（入力順を尊重）
-    return sep.join(s[word_col].astype(str).tolist())
+    words = df[word_col].to_numpy()
+    if mask is not None:
+        words = words[mask]
+    words = words.tolist()
+    try:
+        # 通常は全要素が str なので、要素ごとの str() を省いてそのまま結合する
+        return sep.join(words)
+    except TypeError:
+        return sep.join(map(str, words))
+
+
+def tokenize_to_text(
+    df: pd.DataFrame,
+    *,
+    id_col: str = "article_id",
+    text_col: str = "article",
+    engine: str = "janome",
+    tokenizer=None,
+    tokenize_text_fn: Optional[Callable[[str], List[Tuple[str, str, Any]]]] = None,
+    use_base_form: bool = True,
+    sep: str = " ",
+    pos_keep: Optional[Iterable[str]] = None,
+    pos_exclude: Optional[Iterable[str]] = None,
+    stopwords=None,
+    per_doc: bool = False,
+    strict: bool = True,
+):
+    """
+    tokens_to_text(tokenize_df(df, ...), ...) と同じ結果を、token DataFrame を作らずに返す。
+
+    WordCloud 用の分かち書きテキストだけが欲しい場合など、縦持ち DataFrame が
+    要らないときに使う。文書ごとに tokenize → フィルタ → 結合を 1回で済ませるので、
+    全トークンぶんの DataFrame を持たずに済み、メモリが大きく減る。
+    同じ本文は 1回だけトークナイズする（tokenize_df の dedupe=True と同じ）。
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        入力 DataFrame（文書単位）
+    id_col : str
+        文書ID列名（per_doc=True のときに使用）
+    text_col : str
+        テキスト列名
+    engine, tokenizer, tokenize_text_fn, use_base_form :
+        tokenize_df と同じ
+    sep : str
+        トークン間の区切り文字
+    pos_keep, pos_exclude, stopwords, strict :
+        tokens_to_text と同じ
+    per_doc : bool, default False
+        True の場合、文書ごとの text を返す（tokens_to_text と同じ形式）
+
+    Returns
+    -------
+    str or pandas.DataFrame
+        per_doc=False: str（全体を 1 本に結合）
+        per_doc=True : pandas.DataFrame（columns: [id_col, "text"]）
+
+    Notes
+    -----
+    n_jobs（並列処理）には対応しない。文書数が多く並列化したい場合は tokenize_df を使う。
+    """
+    if text_col not in df.columns:
+        raise KeyError(
+            f"tokenize_to_text: DataFrame に text_col={text_col!r} 列がありません。"
+            f"存在する列: {list(df.columns)}"
+        )
+    if per_doc and id_col not in df.columns:
+        raise KeyError(
+            f"tokenize_to_text: DataFrame に id_col={id_col!r} 列がありません。"
+            f"存在する列: {list(df.columns)}"
+        )
+
+    keep_set, excl_set = _compile_pos_filter(pos_keep, pos_exclude, strict=strict)
+    sw_set = _normalize_stopwords(stopwords)
+    if tokenize_text_fn is None:
+        # 品詞フィルタは組み込みの tokenizer の中で掛ける（tokenize_df と同じ）
+        tokenize_text_fn = _make_tokenize_text_fn(
+            engine,
+            tokenizer,
+            use_base_form,
+            None,
+            frozenset(keep_set) if keep_set is not None else None,
+            frozenset(excl_set) if excl_set is not None else None,
+        )
+        keep_set = excl_set = None
+
+    # 本文 -> 結合済みテキスト（トークンが 1つも残らない場合は None）
+    memo: Dict[Any, Optional[str]] = {}
+    joined_rows: List[Optional[str]] = []
+    for text in df[text_col].to_numpy().tolist():
+        if text in memo:
+            joined_rows.append(memo[text])
+            continue
+        words = [
+            w for w, p, _ in tokenize_text_fn(text)
+            if (keep_set is None or p in keep_set)
+            and (excl_set is None or p not in excl_set)
+            and w not in sw_set
+        ]
+        if not words:
+            joined = None
+        else:
+            try:
+                joined = sep.join(words)
+            except TypeError:
+                joined = sep.join(map(str, words))
+        memo[text] = joined
+        joined_rows.append(joined)
+    del memo
+
+    if per_doc:
+        # tokens_to_text(per_doc=True) と同じく、文書IDの初出順・欠損 ID は除く
+        by_doc: Dict[Any, List[str]] = defaultdict(list)
+        for doc_id, joined in zip(df[id_col].tolist(), joined_rows):
+            if joined is not None and not pd.isna(doc_id):
+                by_doc[doc_id].append(joined)
+        return pd.DataFrame(
+            {
+                id_col: pd.Series(list(by_doc), dtype=df[id_col].dtype),
+                "text": [sep.join(v) for v in by_doc.values()],
+            }
+        )
+
+    return sep.join(j for j in joined_rows if j is not None)
 
 
 __all__ = [
     "tokenize_df",
+    "iter_tokenize_df",
     "tokenize_text_janome",
     "tokenize_text_sudachi",
+    "tokenize_text_fugashi",
     "filter_tokens_df",
     "tokens_to_text",
+    "tokenize_to_text",
 ]